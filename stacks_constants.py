@@ -1,6 +1,13 @@
 """Blender «Stacks» add-on constants"""
 
 SUFFIX = '_trueops_ref'  # to be added to the names of the original objects used as hidden references.
+UPD_OPS_DELAY = .05  # seconds to collect property changes before executing stacks once. For upd_ops.
+UI_STCK = 1 << 0  # bits of STACKS_PROP_ScCommon.ui_closed_mask, set when the corresponding UI box is collapsed.
+UI_LIST = 1 << 1
+UI_TYPE = 1 << 2
+UI_INTR = 1 << 3
+UI_SETS = 1 << 4
+UI_PRESETS = 1 << 5
 __syncable = True  # to be used in INTERPOLATE to determine if the property is syncable. For STACKS_PropValues.
 INTERPOLATE = {  # determines which attributes are used for defining the key attribute in the interpolation mode.
     "GENERATE": {
@@ -30,6 +30,8 @@ Operator Class names to be used in the STACKS_OpExec:
 "NONE" and "SKIP" operators are blocked outside this class, no need to define them here.
 """
 from __future__ import annotations
+import re
+import numpy as np
 from mathutils import Euler
 from abc import ABC, abstractmethod
 from functools import wraps
@@ -37,10 +39,13 @@ from functools import wraps
 if __name__ == '__main__':
     try:  # PyCharm import
         from stacks_support_common import *
+        from stacks_support_common import indices_get
     except ModuleNotFoundError:  # Blender Text Editor import
         from stacks.stacks_support_common import *
+        from stacks.stacks_support_common import indices_get
 else:  # Add-on import
     from .stacks_support_common import *
+    from .stacks_support_common import indices_get
 
 
 class STACKS_OpExec:
@@ -270,30 +275,24 @@ class SelectSet(STACKS_Op):
 
     def operator(self) -> None:
         bpy.ops.mesh.select_all(action='DESELECT')
-
-        data = self.op.selection.split('|')
-        modes = data[0].split('-')
-        m1 = True if modes[0] == 'T' else False
-        m2 = True if modes[1] == 'T' else False
-        m3 = True if modes[2] == 'T' else False
-        self.context.tool_settings.mesh_select_mode = (m1, m2, m3)
+        self.context.tool_settings.mesh_select_mode = self.op.sel_mode
 
         setmode(self.context, 'OBJECT')
 
-        mesh_data = data[1].split('-')
-        verts = [int(v.strip()) for v in mesh_data[0][1:-1].split(',')]
-        edges = [int(e.strip()) for e in mesh_data[1][1:-1].split(',')]
-        faces = [int(f.strip()) for f in mesh_data[2][1:-1].split(',')]
-        try:
-            for v in verts:
-                self.context.object.data.vertices[v].select = True
-            for e in edges:
-                self.context.object.data.edges[e].select = True
-            for f in faces:
-                self.context.object.data.polygons[f].select = True
-        except IndexError:
+        mesh = self.context.object.data
+        elements = (
+            (mesh.vertices, indices_get(self.op.sel_verts)),
+            (mesh.edges, indices_get(self.op.sel_edges)),
+            (mesh.polygons, indices_get(self.op.sel_faces)),
+        )
+        if any(len(indices) and indices.max() >= len(data) for data, indices in elements):
             msg = "Can not set selection. The stored vertex data indices are out of range"
             bpy.ops.stacks.warning('INVOKE_DEFAULT', type="ERROR", msg=msg)
+            return
+        for data, indices in elements:
+            selected = np.zeros(len(data), dtype=bool)
+            selected[indices] = True
+            data.foreach_set("select", selected)
 
 
 # -------------------------------------------------------- HIDE --------------------------------------------------------
@@ -1091,3 +1090,13 @@ class FillFillholes(STACKS_Op):
 
     def operator(self) -> None:
         bpy.ops.mesh.fill_holes(sides=self.op.fill_holes)
+
+
+# ------------------------------------------------------ DISPATCH ------------------------------------------------------
+
+
+OP_DISPATCH = {  # (optype, opfunc) Enum identifiers: Operator class, e.g. ('GENERATE', 'EXTRUDE'): GenerateExtrude
+    tuple(s.upper() for s in re.fullmatch(r'([A-Z][a-z0-9]*)([A-Z]\w*)', name).groups()): cls
+    for name, cls in tuple(globals().items())
+    if isinstance(cls, type) and issubclass(cls, STACKS_Op) and cls is not STACKS_Op
+}
@@ -0,0 +1,93 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+#  Stacks
+#  Collect Blender operators to stacks and execute them. Blender 3.1+ add-on
+#  (c) 2022 Andrey Sokolov (so_records)
+
+"""Blender «Stacks» add-on numeric kernels"""
+
+import numpy as np
+
+try:  # Numba is not shipped with Blender, kernels stay vectorized numpy without it
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback decorator returning the function untouched"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+EASE_INOUT = 0
+EASE_IN = 1
+EASE_OUT = 2
+
+EASE_MODES = {
+    'INOUT': EASE_INOUT,
+    'IN': EASE_IN,
+    'OUT': EASE_OUT,
+}
+
+
+@njit(cache=True, fastmath=True)
+def ease_factors(repeat: int, reverse: bool, ease_in: float, ease_out: float, mode: int) -> np.ndarray:
+    """Return interpolation factors for every iteration of the Operator repeat"""
+    ind = np.arange(repeat).astype(np.float64)
+    v = (repeat - ind) / repeat if reverse else ind / repeat
+    rising = (1 - v) * ease_in + v * ease_out
+    falling = v * ease_in + (1 - v) * ease_out
+    if mode == EASE_IN:
+        return rising
+    if mode == EASE_OUT:
+        return falling
+    return np.where(v <= 0.5, rising, falling)
+
+
+@njit(cache=True, fastmath=True)
+def map_range(factors: np.ndarray, val_min: np.ndarray, val_max: np.ndarray) -> np.ndarray:
+    """Map (repeat, components) factors onto the [val_min, val_max] range of every component"""
+    values = np.empty(factors.shape, dtype=np.float64)
+    span = val_max - val_min  # constant per component, computed once for all the iterations
+    for i in range(factors.shape[0]):
+        for j in range(factors.shape[1]):
+            values[i, j] = val_min[j] + span[j] * factors[i, j]
+    return values
+
+
+@njit(cache=True, fastmath=True)
+def sphere_mask(verts: np.ndarray, center: np.ndarray, radius: float) -> np.ndarray:
+    """
+    Return mask of the vertices closer to center than radius, compared by squared distances without sqrt.
+    Vectorized so the plain numpy fallback stays fast, Numba fuses it into a single pass
+    """
+    vectors = verts - center
+    return (vectors * vectors).sum(axis=1) < radius * radius
+
+
+@njit(cache=True)
+def stacks_plan(enabled: np.ndarray, stack_index: np.ndarray, stacks_count: int) -> np.ndarray:
+    """Return indices of the enabled object stacks with their scene stack existence: (N, 2) array of (index, exists)"""
+    plan = np.empty((enabled.shape[0], 2), dtype=np.int32)
+    n = 0
+    for i in range(enabled.shape[0]):
+        if enabled[i]:
+            plan[n, 0] = i
+            plan[n, 1] = 1 if stack_index[i] < stacks_count else 0
+            n += 1
+    return plan[:n]
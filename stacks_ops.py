@@ -23,35 +23,38 @@
 """Blender «Stacks» add-on Operators"""
 
 import bpy
-from bpy.types import Operator, Object, Scene, BlenderRNA, ViewLayer, PropertyGroup, UIList, BlendData, Context, Event
+import numpy as np
+from bpy.types import Operator, Object, Scene, BlenderRNA, ViewLayer, PropertyGroup, UIList, BlendData, Context, \
+    Event, bpy_prop_collection
 from bpy.props import StringProperty
-from bpy.utils import unregister_class
+from bpy.utils import register_classes_factory
 from typing import List, Set
 from bpy.app.handlers import render_init as RenderInit, render_complete as RenderComplete, \
     render_cancel as RenderCancel, depsgraph_update_post as DepsgraphUpdate, render_pre as RenderPre
 
 # The following are being imported from the stacks_support:
-# bpy.utils.register_class,
 # bpy.app.handlers.frame_change_post as FrameChange
-# _ctypes.PyObj_FromPtr as Pointer
 
 if __name__ == '__main__':
     try:
         # For PyCharm
         from stacks_support import *
         from stacks_support_common import *
+        from stacks_support_common import indices_set
         from stacks_presets_support import *
         from stacks_support_custom import *
     except ModuleNotFoundError:
         # For Blender
         from stacks.stacks_support import *
         from stacks.stacks_support_common import *
+        from stacks.stacks_support_common import indices_set
         from stacks.stacks_presets_support import *
         from stacks.stacks_support_custom import *
 else:
     # For add-on
     from .stacks_support import *
     from .stacks_support_common import *
+    from .stacks_support_common import indices_set
     from .stacks_presets_support import *
     from .stacks_support_custom import *
 
@@ -103,6 +106,22 @@ class STACKS_OT_Update(Operator):
         return {'FINISHED'}
 
 
+# -------------------------------------------------- UI BOXES COLLAPSE -------------------------------------------------
+
+
+class STACKS_OT_UIToggle(Operator):
+    """Collapse/Expand the menu"""
+    bl_idname = "stacks.ui_toggle"
+    bl_label = "Collapse/Expand"
+    bl_options = {'INTERNAL'}
+    bit: IntProperty(default=0, min=0, options={'HIDDEN', 'SKIP_SAVE'})
+
+    def execute(self, context: Context) -> Set[str]:
+        """Blender operators' predeclared execute method"""
+        context.scene.stacks_common.ui_closed_mask ^= self.bit
+        return {'FINISHED'}
+
+
 # ------------------------------------------------------ SLOT ADD ------------------------------------------------------
 
 
@@ -218,7 +237,7 @@ class STACKS_OT_New(Operator):
         stack = sc.stacks[sc.stacks_active]
         stack.name = stack_name
         new_index = len(sc.stacks) - 1
-        ob.stacks[ob.stacks_active].stack = f'{new_index:03d}'
+        ob.stacks[ob.stacks_active].stack = stack_enum_id(new_index)
         ob.stacks_c[ob.stacks_active].stack_index = new_index
 
     def execute(self, context: Context) -> Set[str]:
@@ -269,7 +288,7 @@ class STACKS_OT_Duplicate(Operator):
     def __set_ob_stack_index(context: Context) -> None:
         new_index = len(context.scene.stacks) - 1
         context.object.stacks_c[context.object.stacks_active].stack_index = new_index
-        context.object.stacks[context.object.stacks_active].stack = str(f"{new_index:03d}")
+        context.object.stacks[context.object.stacks_active].stack = stack_enum_id(new_index)
 
     def execute(self, context: Context) -> Set[str]:
         bpy.ops.ed.undo_push()
@@ -285,7 +304,7 @@ class STACKS_OT_Duplicate(Operator):
         self.__set_ob_stack_index(context)
         context.scene.update_tag()
         ob.stacks_common.live_update = live_update
-        upd_ops(self, context)
+        upd_ops_execute(self, context)
         return {'FINISHED'}
 
 
@@ -321,7 +340,10 @@ class STACKS_OT_Remove(Operator):
         """Remove Scene Selection"""
         ob = context.object
         ob_stack = ob.stacks_c[ob.stacks_active]
-        ob_stack.selection = "f-f-t|[]-[]-[]"
+        ob_stack.sel_mode = (False, False, True)
+        ob_stack.sel_verts.clear()
+        ob_stack.sel_edges.clear()
+        ob_stack.sel_faces.clear()
 
     def execute(self, context: Context) -> Set[str]:
         """Blender operators' predeclared execute method"""
@@ -389,7 +411,7 @@ class STACKS_OT_Apply(Operator):
         return {'FINISHED'}
 
 
-# ----------------------------- STORE SELECTED MESH ELEMENTS INTO OPERATOR'S STRING PROPERTY ---------------------------
+# ----------------------------- STORE SELECTED MESH ELEMENTS INTO OBJECT'S SELECTION STACK -----------------------------
 
 
 class STACKS_OT_SelectStore(Operator):
@@ -403,33 +425,22 @@ class STACKS_OT_SelectStore(Operator):
         return context.object is not None and context.object.type == 'MESH'
 
     @staticmethod
-    def __modes(context: Context) -> str:
-        """Interpret context selection mode as a string in the specified format"""
-        modes = context.tool_settings.mesh_select_mode
-        m1 = 'T' if modes[0] else 'S'
-        m2 = 'T' if modes[1] else 'S'
-        m3 = 'T' if modes[2] else 'S'
-        return f"{m1}-{m2}-{m3}"
-
-    @staticmethod
-    def __data(context: Context) -> str:
-        """Interpret context selection data as a string in the specified format"""
-        verts = [v.index for v in context.object.data.vertices if v.select]
-        edges = [e.index for e in context.object.data.edges if e.select]
-        faces = [f.index for f in context.object.data.polygons if f.select]
-        return f"|{verts}-{edges}-{faces}"
-
-    def __get_selection(self, context: Context) -> str:
-        """
-        Get current mesh selection data as a string in the specified format:
-        T-T-T|[List of vertices indices]-[List of edges indices]-[List of faces indices]
-        """
+    def __selected(data: bpy_prop_collection) -> np.ndarray:
+        """Return indices of the selected mesh elements"""
+        selected = np.empty(len(data), dtype=bool)
+        data.foreach_get("select", selected)
+        return np.flatnonzero(selected)
+
+    def __store_selection(self, context: Context, stack: PropertyGroup) -> None:
+        """Store current mesh selection mode and selected elements indices into the object's stack"""
         assert context.mode == 'EDIT_MESH'
-        modes = self.__modes(context)
+        stack.sel_mode = context.tool_settings.mesh_select_mode
         setmode(context, 'OBJECT')
-        data = self.__data(context)
+        mesh = context.object.data
+        indices_set(stack.sel_verts, self.__selected(mesh.vertices))
+        indices_set(stack.sel_edges, self.__selected(mesh.edges))
+        indices_set(stack.sel_faces, self.__selected(mesh.polygons))
         setmode(context, 'EDIT')
-        return modes + data
 
     def execute(self, context: Context) -> Set[str]:
         """Blender operators' predeclared execute method"""
@@ -437,7 +448,7 @@ class STACKS_OT_SelectStore(Operator):
             setmode(context, 'EDIT')
             return {'FINISHED'}
         ob = context.object
-        ob.stacks_c[ob.stacks_active].selection = self.__get_selection(context)
+        self.__store_selection(context, ob.stacks_c[ob.stacks_active])
         return {'FINISHED'}
 
 
@@ -466,7 +477,7 @@ class STACKS_OT_NewTextPopup(Operator):
         """Blender operators' predeclared execute method"""
         text_name = self.__set_name(self.name)
         new = bpy.data.texts.new(text_name)
-        context.scene.stacks_common.save_to = new
+        context.scene.stacks_common.save_to = new.name
         bpy.ops.stacks.preset_save()
         msg = f'Preset "{text_name}" has been added to Blender Texts'
         self.report({'INFO'}, msg)
@@ -493,9 +504,9 @@ class STACKS_OT_TextDeletePopup(Operator):
     def execute(self, context: Context) -> Set[str]:
         """Blender operators' predeclared execute method"""
         props = context.scene.stacks_common
-        text = props.save_to if props.save_preset else props.load_from
-        text_name = str(text.name)
-        if self.delete:
+        text_name = props.save_to if props.save_preset else props.load_from
+        text = bpy.data.texts.get(text_name)
+        if self.delete and text is not None:
             bpy.data.texts.remove(text)
         self.report({'INFO'}, f'Text "{text_name}" deleted')
         return {'FINISHED'}
@@ -518,12 +529,12 @@ class STACKS_OT_TextDelete(Operator):
     def poll(cls, context: Context) -> bool:
         """Conditions enabling execution of the Blender operator"""
         props = context.scene.stacks_common
-        return all((props.save_preset, props.save_to))
+        return props.save_preset and props.save_to in bpy.data.texts
 
     def execute(self, context: Context) -> Set[str]:
         """Blender operators' predeclared execute method"""
         props = context.scene.stacks_common
-        preset_file = props.save_to
+        preset_file = bpy.data.texts[props.save_to]
         if len(preset_file.lines) > 1 or preset_file.lines[0].body:
             bpy.ops.stacks.del_text_popup('INVOKE_DEFAULT')
         return {'FINISHED'}
@@ -544,7 +555,7 @@ class STACKS_OT_PresetSave(Operator):
         ob = context.object
         props = sc.stacks_common
         index = ob.stacks_c[ob.stacks_active].stack_index
-        return all((props.save_preset, props.save_to, index < len(sc.stacks)))
+        return all((props.save_preset, props.save_to in bpy.data.texts, index < len(sc.stacks)))
 
     def execute(self, context: Context) -> Set[str]:
         """Blender operators' predeclared execute method"""
@@ -553,7 +564,7 @@ class STACKS_OT_PresetSave(Operator):
         props = sc.stacks_common
         sc_stack = sc.stacks[ob.stacks_c[ob.stacks_active].stack_index]
         ops = sc.stacks[ob.stacks_c[ob.stacks_active].stack_index].ops
-        preset_file = props.save_to
+        preset_file = bpy.data.texts[props.save_to]
         if (len(preset_file.lines) > 1 or preset_file.lines[0].body) and not props.overwrite:
             msg = 'Selected Text is not empty. Enable "Overwrite" or select another Text or create new one'
             bpy.ops.stacks.warning("INVOKE_DEFAULT", msg=msg, type='ERROR')
@@ -578,13 +589,13 @@ class STACKS_OT_PresetLoad(Operator):
     def poll(cls, context: Context) -> bool:
         """Conditions enabling execution of the Blender operator"""
         props = context.scene.stacks_common
-        return all((props.load_preset, props.load_from))
+        return props.load_preset and props.load_from in bpy.data.texts
 
     def execute(self, context: Context) -> Set[str]:
         """Blender operators' predeclared execute method"""
         sc = context.scene
         props = sc.stacks_common
-        preset_file = props.load_from
+        preset_file = bpy.data.texts[props.load_from]
         preset = STACKS_PresetsOps(preset_file)
         preset.load_preset(context)
         props.load_preset = False
@@ -621,15 +632,14 @@ class STACKS_OT_RenderAnimation(Operator):
     @classmethod
     def poll(cls, context: Context):
         """Conditions enabling execution of the Blender operator"""
-        ps = context.scene.stacks_common
-        return ps.animatable and ps.frame_change_id
+        return context.scene.stacks_common.animatable and 'frame_change' in scene_handlers(context.scene)
 
     def __structure(self) -> None:
         """Setup self variables, handlers and timer instead of __init__()"""
         self.render_path = self.sc.render.filepath
         self.frame = self.sc.frame_current
         self.frames = self.__frames()
-        self.frame_change = Pointer(int(self.sc.stacks_common.frame_change_id))
+        self.frame_change = scene_handlers(self.sc)['frame_change']
         assert callable(self.frame_change)
         self.__pre_render_handlers_clear()
         self.__pre_render_handlers_append()
@@ -641,8 +651,8 @@ class STACKS_OT_RenderAnimation(Operator):
 
     def __pre_render_handlers_clear(self) -> None:
         """Remove regular limiting functions from render handlers"""
-        r_init = Pointer(int(self.sc.stacks_common.render_init_id))
-        r_complete = Pointer(int(self.sc.stacks_common.render_complete_id))
+        r_init = scene_handlers(self.sc)['render_init']
+        r_complete = scene_handlers(self.sc)['render_complete']
 
         # just to keep links to the original limiting functions in the memory
         # so that they are not cleaned up by the garbage collector:
@@ -696,9 +706,9 @@ class STACKS_OT_RenderAnimation(Operator):
 
     def __post_render_handlers_append(self) -> None:
         """Append regular limiting functions to render handlers"""
-        RenderInit.append(Pointer(int(self.sc.stacks_common.render_init_id)))
-        RenderComplete.append(Pointer(int(self.sc.stacks_common.render_complete_id)))
-        RenderCancel.append(Pointer(int(self.sc.stacks_common.render_complete_id)))
+        RenderInit.append(scene_handlers(self.sc)['render_init'])
+        RenderComplete.append(scene_handlers(self.sc)['render_complete'])
+        RenderCancel.append(scene_handlers(self.sc)['render_complete'])
 
     def __fix_write_still(self) -> None:
         """
@@ -744,7 +754,7 @@ class STACKS_OT_RenderAnimation(Operator):
 
     def __fr_change_off(self) -> None:
         """Remove Stacks Execute function from the bpy.app.handlers.frame_change_post handler"""
-        assert self.frame_change == Pointer(int(self.sc.stacks_common.frame_change_id))
+        assert self.frame_change == scene_handlers(self.sc)['frame_change']
         for f in FrameChange:
             if f == self.frame_change:
                 while f in FrameChange:
@@ -752,7 +762,7 @@ class STACKS_OT_RenderAnimation(Operator):
 
     def __fr_change_on(self) -> None:
         """Append Stacks Execute function to the bpy.app.handlers.frame_change_post handler"""
-        self.frame_change = Pointer(int(self.sc.stacks_common.frame_change_id))
+        self.frame_change = scene_handlers(self.sc)['frame_change']
         for f in FrameChange:
             if f == self.frame_change:
                 return
@@ -854,18 +864,11 @@ classes = [
     STACKS_OT_TextDeletePopup,
     STACKS_OT_TextDelete,
     STACKS_OT_Update,
+    STACKS_OT_UIToggle,
     STACKS_OT_RenderAnimation,
 ]
 
-
-def register():
-    for cl in classes:
-        register_class(cl)
-
-
-def unregister():
-    for cl in reversed(classes):
-        unregister_class(cl)
+register, unregister = register_classes_factory(classes)
 
 
 if __name__ == '__main__':
@@ -25,7 +25,7 @@
 import bpy
 from bpy.types import Operator, Object, Scene, BlenderRNA, ViewLayer, PropertyGroup, UIList, BlendData, Context, Event
 from bpy.props import *
-from bpy.utils import register_class, unregister_class
+from bpy.utils import register_classes_factory
 from typing import Set
 from math import radians, pi
 
@@ -48,6 +48,52 @@ else:
 
 # --------------------------------------------------- CUSTOM SELECT ----------------------------------------------------
 
+_ELEMENT_TYPE_ITEMS = (
+    ('VERTS', 'Vertices', 'Vertices', 'VERTEXSEL', 0),
+    ('EDGES', 'Edges', 'Edges', 'EDGESEL', 1),
+    ('FACES', 'Faces', 'Faces', 'FACESEL', 2),
+)
+
+_VERT_TYPE_ITEMS = (
+    ('BELOW', 'Below', 'Below', 'SORT_ASC', 0),
+    ('ABOVE', 'Above', 'Above', 'SORT_DESC', 1),
+    ('SPHERE', 'Sphere', 'Sphere', 'SHADING_SOLID', 2),
+    ('EDGENUM', 'Edges Number', 'Number of adjacent edges', 'UV_EDGESEL', 3),
+    ('FACENUM', 'Faces Number', 'Number of adjacent faces', 'UV_FACESEL', 4),
+)
+
+_EDGE_TYPE_ITEMS = (
+    ('BELOW', 'Below', 'Below', 'SORT_ASC', 0),
+    ('ABOVE', 'Above', 'Above', 'SORT_DESC', 1),
+    ('SPHERE', 'Sphere', 'Sphere', 'SHADING_SOLID', 2),
+    ('LENGTH', 'Length', 'Length', 'DRIVER_DISTANCE', 3),
+    ('FACENUM', 'Faces number', 'Number of adjacent faces', 'UV_EDGESEL', 4),
+)
+
+_FACE_TYPE_ITEMS = (
+    ('BELOW', 'Below', 'Below', 'SORT_ASC', 0),
+    ('ABOVE', 'Above', 'Above', 'SORT_DESC', 1),
+    ('SPHERE', 'Sphere', 'Sphere', 'SHADING_SOLID', 2),
+    ('VNUM', 'Vertex number', 'Number of vertices', 3),
+    ('AREA', 'Area', 'Area', 'FULLSCREEN_ENTER', 4),
+)
+
+_AXIS_ITEMS = (
+    ('X', 'X', 'X', 'EVENT_X', 0),
+    ('Y', 'Y', 'Y', 'EVENT_Y', 1),
+    ('Z', 'Z', 'Z', 'EVENT_Z', 2),
+)
+
+_PIVOT_ITEMS = (
+    ('MANUAL', 'Manual', 'Manual', 'EMPTY_ARROWS', 0),
+    ('OBJECT', 'Object', 'Object', 'MESH_CUBE', 1),
+)
+
+_ORIENTATION_ITEMS = (
+    ('LOCAL', 'Local', 'Local', 'ORIENTATION_LOCAL', 0),
+    ('GLOBAL', 'Global', 'Global', 'ORIENTATION_GLOBAL', 1),
+)
+
 
 class STACKS_OT_CUSTOM_Select(Operator):
     """Custom Selection Operator"""
@@ -55,48 +101,16 @@ class STACKS_OT_CUSTOM_Select(Operator):
     bl_label = "Custom Select"
     clear_previous_selection: BoolProperty(name="Clear Previous Selection", default=False)
     deselect: BoolProperty(name="Deselect", default=False)
-    element_type: EnumProperty(name="Element Type", items={
-        ("VERTS", "Vertices", "Vertices", "VERTEXSEL", 0),
-        ("EDGES", "Edges", "Edges", "EDGESEL", 1),
-        ("FACES", "Faces", "Faces", "FACESEL", 2),
-    }, default="VERTS")
+    element_type: EnumProperty(name="Element Type", items=_ELEMENT_TYPE_ITEMS, default="VERTS")
     sel_mode_verts: BoolProperty(name="Element Type", default=True)
     sel_mode_edges: BoolProperty(name="Element Type", default=False)
     sel_mode_faces: BoolProperty(name="Element Type", default=False)
-    vert_type: EnumProperty(name="Selection Type", items={
-        ("BELOW", "Below", "Below", "SORT_ASC", 0),
-        ("ABOVE", "Above", "Above", "SORT_DESC", 1),
-        ("SPHERE", "Sphere", "Sphere", "SHADING_SOLID", 2),
-        ("EDGENUM", "Edges Number", "Number of adjacent edges", "UV_EDGESEL", 3),
-        ("FACENUM", "Faces Number", "Number of adjacent faces", "UV_FACESEL", 4),
-    }, default="SPHERE")
-    edge_type: EnumProperty(name="Selection Type", items={
-        ("BELOW", "Below", "Below", "SORT_ASC", 0),
-        ("ABOVE", "Above", "Above", "SORT_DESC", 1),
-        ("SPHERE", "Sphere", "Sphere", "SHADING_SOLID", 2),
-        ("LENGTH", "Length", "Length", "DRIVER_DISTANCE", 3),
-        ("FACENUM", "Faces number", "Number of adjacent faces", "UV_EDGESEL", 4)
-    }, default="LENGTH")
-    face_type: EnumProperty(name="Selection Type", items={
-        ("BELOW", "Below", "Below", "SORT_ASC", 0),
-        ("ABOVE", "Above", "Above", "SORT_DESC", 1),
-        ("SPHERE", "Sphere", "Sphere", "SHADING_SOLID", 2),
-        ("VNUM", "Vertex number", "Number of vertices", 3),
-        ("AREA", "Area", "Area", "FULLSCREEN_ENTER", 4)
-    }, default="VNUM")
-    axis: EnumProperty(name="Axis", items={
-        ("X", "X", "X", "EVENT_X", 0),
-        ("Y", "Y", "Y", "EVENT_Y", 1),
-        ("Z", "Z", "Z", "EVENT_Z", 2),
-    }, default="Z")
-    pivot: EnumProperty(name="Pivot Point", items={
-        ("MANUAL", "Manual", "Manual", "EMPTY_ARROWS", 0),
-        ("OBJECT", "Object", "Object", "MESH_CUBE", 1),
-    }, default="MANUAL")
-    orientation: EnumProperty(name="Orientation", items={
-        ("LOCAL", "Local", "Local", "ORIENTATION_LOCAL", 0),
-        ("GLOBAL", "Global", "Global", "ORIENTATION_GLOBAL", 1),
-    }, default="LOCAL")
+    vert_type: EnumProperty(name="Selection Type", items=_VERT_TYPE_ITEMS, default="SPHERE")
+    edge_type: EnumProperty(name="Selection Type", items=_EDGE_TYPE_ITEMS, default="LENGTH")
+    face_type: EnumProperty(name="Selection Type", items=_FACE_TYPE_ITEMS, default="VNUM")
+    axis: EnumProperty(name="Axis", items=_AXIS_ITEMS, default="Z")
+    pivot: EnumProperty(name="Pivot Point", items=_PIVOT_ITEMS, default="MANUAL")
+    orientation: EnumProperty(name="Orientation", items=_ORIENTATION_ITEMS, default="LOCAL")
     center: FloatVectorProperty(name="Center", default=(0, 0, 0))
     center_target: StringProperty(name="Target Object Name", default="")
     sphere_size: FloatProperty(name="Noise Threshold", default=1, min=0)
@@ -141,25 +155,32 @@ class STACKS_OT_CUSTOM_Decimate(Operator):
         return self.execute(context)
 
 
+_SUBJECT_ITEMS = (
+    ('NONE', 'None', 'None', 'BLANK1', 0),
+    ('SELECTION', 'Selection', 'Selection', 'BLANK1', 1),
+    ('OBJECT', 'Object', 'Object', 'BLANK1', 2),
+)
+
+_OPERATION_ITEMS = (
+    ('INTERSECT', 'Intersect', 'Intersect', 'BLANK1', 0),
+    ('UNION', 'Union', 'Union', 'BLANK1', 1),
+    ('DIFFERENCE', 'Difference', 'Difference', 'BLANK1', 2),
+)
+
+_SOLVER_ITEMS = (
+    ('FAST', 'Fast', 'Fast', 'BLANK1', 0),
+    ('EXACT', 'Exact', 'Exact', 'BLANK1', 1),
+)
+
+
 class STACKS_OT_CUSTOM_Boolean(Operator):
     """Custom Boolean Operator"""
     bl_idname = "stacks.custom_boolean"
     bl_label = "Custom Select"
-    subject: EnumProperty(name="Subject", items={
-        ("NONE", "None", "None", "BLANK1", 0),
-        ("SELECTION", "Selection", "Selection", "BLANK1", 1),
-        ("OBJECT", "Object", "Object", "BLANK1", 2),
-    }, default="NONE")
-    operation: EnumProperty(name="Subject", items={
-        ("INTERSECT", "Intersect", "Intersect", "BLANK1", 0),
-        ("UNION", "Union", "Union", "BLANK1", 1),
-        ("DIFFERENCE", "Difference", "Difference", "BLANK1", 2),
-    }, default="DIFFERENCE")
+    subject: EnumProperty(name="Subject", items=_SUBJECT_ITEMS, default="NONE")
+    operation: EnumProperty(name="Subject", items=_OPERATION_ITEMS, default="DIFFERENCE")
     object_name: StringProperty(default="")
-    solver: EnumProperty(name="Solver", items={
-        ("FAST", "Fast", "Fast", "BLANK1", 0),
-        ("EXACT", "Exact", "Exact", "BLANK1", 1),
-    }, default="FAST")
+    solver: EnumProperty(name="Solver", items=_SOLVER_ITEMS, default="FAST")
     overlap_threshold: FloatProperty(default=0.000001)
     self_intersection: BoolProperty(default=False)
     hole_tolerant: BoolProperty(default=False)
@@ -254,15 +275,7 @@ classes = [
     STACKS_OT_AssignVgroup
 ]
 
-
-def register():
-    for cl in classes:
-        register_class(cl)
-
-
-def unregister():
-    for cl in reversed(classes):
-        unregister_class(cl)
+register, unregister = register_classes_factory(classes)
 
 
 if __name__ == '__main__':
@@ -29,11 +29,11 @@ from typing import List, Tuple, Union
 from mathutils import Euler, Vector
 if __name__ == '__main__':
     try:  # PyCharm import
-        from stacks_support import upd_ops
+        from stacks_support import upd_ops_execute
     except ModuleNotFoundError:  # Blender Text Editor import
-        from stacks.stacks_support import upd_ops
+        from stacks.stacks_support import upd_ops_execute
 else:  # Add-on import
-    from .stacks_support import upd_ops
+    from .stacks_support import upd_ops_execute
 
 
 class STACKS_PresetsOps:
@@ -180,4 +180,4 @@ class STACKS_PresetsOps:
         self.__set_ops(stack, ops)
         context.scene.stacks[-1].name = preset.stack_name
         ob.stacks_common.live_update = live_update
-        upd_ops(self, context)
+        upd_ops_execute(self, context)
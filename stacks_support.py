@@ -24,32 +24,39 @@
 
 from __future__ import annotations
 import random
-from bpy.types import Object, Scene, BlenderRNA, PropertyGroup, Context, Modifier, Mesh
-from bpy.props import *
-from bpy.utils import register_class
+import re
+import numpy as np
+from operator import attrgetter, itemgetter
+from bpy.types import Object, Scene, BlenderRNA, PropertyGroup, Context, Mesh, Struct, Action
 from bpy.ops import _BPyOpsSubModOp
 from mathutils import Vector
-from typing import List, Union, Tuple, Set, Dict
+from typing import List, Union, Tuple, Set, Dict, Sequence, Callable
 from bpy.app.handlers import frame_change_post as FrameChange
-from _ctypes import PyObj_FromPtr as Pointer
-from functools import wraps
+from functools import wraps, lru_cache
+from contextlib import contextmanager
 
 if __name__ == '__main__':
     try:  # PyCharm import
         import stacks_exe
         from stacks_support_common import *
+        from stacks_support_common import indices_set
         from stacks_exe import STACKS_OpExec
         from stacks_constants import *
+        from stacks_kernels import ease_factors, map_range, stacks_plan, EASE_MODES
     except ModuleNotFoundError:  # Blender Text Editor import
         from . import stacks_exe
         from stacks.stacks_support_common import *
+        from stacks.stacks_support_common import indices_set
         from stacks.stacks_exe import STACKS_OpExec
         from stacks.stacks_constants import *
+        from stacks.stacks_kernels import ease_factors, map_range, stacks_plan, EASE_MODES
 else:  # Add-on import
     from . import stacks_exe
     from .stacks_support_common import *
+    from .stacks_support_common import indices_set
     from .stacks_exe import STACKS_OpExec
     from .stacks_constants import *
+    from .stacks_kernels import ease_factors, map_range, stacks_plan, EASE_MODES
 
 
 # ---------------------------------------------- UPD OBJECT SETUP SUPPORT ----------------------------------------------
@@ -60,6 +67,16 @@ class STACKS_ObjectSetup:
     To be inherited by STACKS_ExecuteStacks
     Determines which object is used as Stacks Object and which as its Mesh reference
     """
+    _ob_props: Tuple[Tuple[str, bool], ...] = ()  # Object RNA properties to be copied: (identifier, is collection)
+
+    @classmethod
+    def __ob_props(cls) -> Tuple[Tuple[str, bool], ...]:
+        """Return Object properties to be copied. Read from RNA once, after the add-on properties are registered"""
+        if not cls._ob_props:
+            cls._ob_props = tuple(
+                (p.identifier, p.type == 'COLLECTION') for p in Object.bl_rna.properties
+                if p.identifier not in {"rna_type", "data", "name"} and (p.type == 'COLLECTION' or not p.is_readonly))
+        return cls._ob_props
 
     @staticmethod
     def __mesh_from_ref(context: Context, ref: Object) -> Mesh:
@@ -70,26 +87,33 @@ class STACKS_ObjectSetup:
         except RuntimeError:
             return None
 
-    def __iterable_copy(self, props_trg, props_src, prop: str) -> None:
-        try:
-            iterable_trg = getattr(props_trg, prop)
-            iterable_src = getattr(props_src, prop)
-            if type(iterable_trg) == str:
-                return
-            for s in iterable_src:
-                index = len(iterable_trg)
-                try:
-                    iterable_trg.add()
-                    iterable_trg[index].index = index
-                except AttributeError as exp:
-                    pass
-                try:
-                    setattr(iterable_trg, s, getattr(iterable_src, s))
-                except AttributeError:
-                    continue
-                self.__iterable_copy(getattr(iterable_trg[index], iterable_src[index], s))
-        except TypeError:
+    def __iterable_copy(self, trg: bpy_prop_collection, src: bpy_prop_collection, rna: Struct) -> None:
+        """
+        Copy add-on collection items: numeric fields in bulk with foreach_get/foreach_set, others item by item.
+        Blender built-in collections (modifiers, constraints, etc.) have no add() and are skipped
+        """
+        if not hasattr(trg, "add"):
             return
+        for _ in range(len(src) - len(trg)):
+            trg.add()
+        for p in rna.properties:
+            if p.identifier == "rna_type":
+                continue
+            if p.type == 'COLLECTION':
+                for s, t in zip(src, trg):
+                    self.__iterable_copy(getattr(t, p.identifier), getattr(s, p.identifier), p.fixed_type)
+            elif p.is_readonly:
+                continue
+            elif p.type in FOREACH_DTYPES:
+                buffer = np.empty(len(src) * max(p.array_length, 1), dtype=FOREACH_DTYPES[p.type])
+                src.foreach_get(p.identifier, buffer)
+                trg.foreach_set(p.identifier, buffer)
+            else:
+                for s, t in zip(src, trg):
+                    try:
+                        setattr(t, p.identifier, getattr(s, p.identifier))
+                    except (TypeError, ValueError):  # e.g. dynamic Enum with no items yet
+                        continue
 
     def __ob_copy(self, context: Context, ob: Object) -> Object:
         """Return a deep copy of the Object"""
@@ -97,13 +121,14 @@ class STACKS_ObjectSetup:
         if mesh is None:
             return None
         new = bpy.data.objects.new(ob.name, mesh)
-        for a in dir(ob):
-            if a.startswith(("__", "bl_")) or callable(getattr(ob, a)) or a in {"data", "name"}:
+        for a, collection in self.__ob_props():
+            if collection:
+                self.__iterable_copy(getattr(new, a), getattr(ob, a), Object.bl_rna.properties[a].fixed_type)
                 continue
             try:
                 setattr(new, a, getattr(ob, a))
-            except AttributeError:
-                self.__iterable_copy(new, ob, a)
+            except (AttributeError, TypeError):
+                continue
         for src, trg in zip(ob.stacks, new.stacks):
             trg.stack = src.stack
         for src, trg in zip(ob.stacks_c, new.stacks_c):
@@ -116,7 +141,7 @@ class STACKS_ObjectSetup:
         for sm in src.modifiers:
             try:
                 tm = trg.modifiers.new(sm.name, sm.type)
-                for a in dir(sm):
+                for a in writable_props(sm):
                     setattr_protected(tm, a, sm)
             except TypeError as exp:
                 print(exp)
@@ -128,7 +153,7 @@ class STACKS_ObjectSetup:
         for sc in src.constraints:
             try:
                 tc = trg.constraints.new(sc.type)
-                for a in dir(sc):
+                for a in writable_props(sc):
                     setattr_protected(tc, a, sc)
             except TypeError as exp:
                 print(exp)
@@ -139,7 +164,7 @@ class STACKS_ObjectSetup:
         """Copy Animation data from src object to trg object"""
         if src.animation_data is not None:
             ad = trg.animation_data_create()
-            for a in dir(ad):
+            for a in writable_props(ad):
                 setattr_protected(ad, a, src.animation_data)
 
     @staticmethod
@@ -187,15 +212,21 @@ class STACKS_ObjectSetup:
 
     def __ob_ref(self, context: Context) -> Tuple[Object, Object]:
         """Return object and its reference (create a copy if it has no reference)"""
-        ob = self.__make_ref(context, context.object) \
-            if context.object.stacks_common.ob_reference is None \
-            else context.object
-        if ob is None:
-            return None, None
-        ref = ob.stacks_common.ob_reference
-        ob.stacks_common.ob_stacks = None
-        ref.stacks_common.ob_stacks = ob
-        ref.stacks_common.ob_reference = None
+        ob = context.object
+        if ob.stacks_common.ob_reference is None:
+            ob = self.__make_ref(context, ob)
+            if ob is None:
+                return None, None
+        props = ob.stacks_common
+        ref = props.ob_reference
+        ref_props = ref.stacks_common
+        # pointers are set once per object: skip rewriting them (and retagging ID relations) on every execution
+        if props.ob_stacks is not None:
+            props.ob_stacks = None
+        if ref_props.ob_stacks != ob:
+            ref_props.ob_stacks = ob
+        if ref_props.ob_reference is not None:
+            ref_props.ob_reference = None
         return ob, ref
 
     def __mesh_copy(self, context: Context, ob: Object, ref: Object) -> Tuple[Object, Object]:
@@ -244,14 +275,14 @@ class STACKS_ObjectSetup:
 class STACKS_Value:
     """
     Interpolation Feature.
-    Storage for the initial value and a list of the interpolated values for the single Operator property.
+    Storage for the initial value and an array of the interpolated values for the single Operator property.
     To be used as STACKS_Values's attribute.
     """
 
     def __init__(self, prop: str):
         self.prop = prop
         self.init = None
-        self.values = []
+        self.values = np.empty(0, dtype=np.single)  # (repeat,) or (repeat, components) for vector properties
 
 
 class STACKS_Values:
@@ -262,10 +293,19 @@ class STACKS_Values:
     """
 
     def __init__(self):
-        pass
+        self._items: List[STACKS_Value] = []
 
     def __iter__(self):
-        return iter([getattr(self, p) for p in dir(self) if not p.startswith("__")])
+        return iter(self._items)
+
+    def append(self, value: STACKS_Value) -> None:
+        self._items.append(value)
+
+
+@lru_cache(maxsize=4096)
+def seeded_random(seed: int) -> float:
+    """Return the same number as random.seed(seed); random.random() without touching the global generator"""
+    return random.Random(seed).random()
 
 
 class STACKS_PropValues:
@@ -274,118 +314,86 @@ class STACKS_PropValues:
     Get a list of Values for the Operator parameter during the interpolation between iterations
     """
 
-    def __init__(self, op: PropertyGroup, repeat: int, optype: str, opfunc: str) -> None:
+    def __init__(self, op: PropertyGroup, repeat: int, propdict: Dict[str, Tuple[str, ...]]) -> None:
         self.op = op
         self.repeat = repeat
-        self.propdict = INTERPOLATE[optype][opfunc]
+        self.propdict = propdict  # INTERPOLATE[optype][opfunc]
+        self.random = op.interp_type == 'RANDOM'  # Operator settings are read once for all its properties
+        self.seed = op.interp_seed
+        self.value_sync = op.value_sync
+        self.factors = None if self.random else ease_factors(
+            repeat, op.interpolate != 'STRAIGHT', op.interp_ease_in, op.interp_ease_out, EASE_MODES[op.interp_ease])
+        self.bounds = {props: (self.__bound(getattr(op, props[0])), self.__bound(getattr(op, props[1])))
+                       for props in self.propdict.values()}
+
+    @staticmethod
+    def __bound(value: Union[float, int, Sequence]) -> Union[float, int, Tuple]:
+        """Detach vector values from RNA to read them once per interpolation"""
+        try:
+            return tuple(value)
+        except TypeError:
+            return value
 
     def __call__(self):
         """Sets up and returns STACKS_Values with STACKS_Value objects as attributes"""
         values = STACKS_Values()
-        for i in range(self.repeat):
-            num = 0
-            for src, props in self.propdict.items():
-                num += 1
-                if not hasattr(values, src):
-                    setattr(values, src, STACKS_Value(src))
-                value = getattr(values, src)
-                if value.init is None:
-                    value.init = getattr(self.op, src)
-                if self.op.interp_type == 'RANDOM':
-                    value.values.append(self.__interp_random(props, i*num))
-                else:
-                    value.values.append(self.__interp_ease(props, i))
+        if self.repeat <= 0:
+            return values
+        for num, (src, props) in enumerate(self.propdict.items(), 1):
+            value = STACKS_Value(src)
+            value.init = getattr(self.op, src)
+            values.append(value)
+            if self.random:
+                value.values = self.__interp_random(props, num)
+            else:
+                value.values = self.__interp_ease(props)
         return values
 
-    def __interp_random(self, props: Tuple[str], ind: int) -> Union[float, Tuple[float, float, float]]:
+    def __interp_random(self, props: Tuple[str], num: int) -> np.ndarray:
         """
-        Get list of the randomly interpolated values.
+        Get array of the randomly interpolated values for all the iterations.
+        Iteration i seeds each vector component with interp_seed + i * num + component index.
 
         args*::
         props:: ('min_val', 'max_val', __syncable/optional, always True/):
-        ind:: iteration index
+        num:: property number in the interpolated properties dict, starting from 1
         """
-        seed = self.op.interp_seed + ind
-        val_min = getattr(self.op, props[0])
-        val_max = getattr(self.op, props[1])
-        try:
-            len(val_min)
-            if self.op.value_sync and len(props) > 2:
-                random.seed(seed)
-                seed += 1
-                x = map_range(random.random(), 0, 1, val_min[0], val_max[0])
-                if type(val_min[0]) == int:
-                    x = int(x)
-                return x, x, x
-            else:
-                random.seed(seed)
-                seed += 1
-                x = map_range(random.random(), 0, 1, val_min[0], val_max[0])
-                random.seed(seed)
-                seed += 1
-                y = map_range(random.random(), 0, 1, val_min[1], val_max[1])
-                random.seed(seed)
-                seed += 1
-                z = map_range(random.random(), 0, 1, val_min[2], val_max[2])
-                if type(val_min[0]) == int:
-                    x = int(x)
-                    y = int(y)
-                    z = int(z)
-                return x, y, z
-        except TypeError:
-            random.seed(seed)
-            seed += 1
-            x = map_range(random.random(), 0, 1, val_min, val_max)
-            if type(val_min) == int:
-                x = int(x)
-            return x
-
-    def __interp_ease(self, props: Tuple[str], ind: int) -> Union[float, Tuple[float, float, float]]:
+        val_min, val_max = self.bounds[props]
+        vector = type(val_min) == tuple
+        sync = vector and self.value_sync and len(props) > 2
+        if sync:
+            val_min, val_max = (val_min[0],) * len(val_min), (val_max[0],) * len(val_max)
+        integer = type(val_min[0] if vector else val_min) == int
+        components = len(val_min) if vector and not sync else 1
+        seeds = self.seed + np.arange(self.repeat)[:, None] * num + np.arange(components)
+        factors = np.fromiter(map(seeded_random, seeds.ravel().tolist()), dtype=np.float64,
+                              count=seeds.size).reshape(seeds.shape)
+        return self.__values(factors, val_min, val_max, vector, integer)
+
+    def __interp_ease(self, props: Tuple[str]) -> np.ndarray:
         """
-        Get list of the values interpolated with Ease In, Ease Out ot Ease In/Out algorithms.
+        Get array of the values interpolated with Ease In, Ease Out ot Ease In/Out algorithms for all the iterations.
 
         args*::
         props:: ('min_val', 'max_val', __syncable/optional, always True/):
-        ind:: iteration index
         """
-        value = ind if self.op.interpolate == 'STRAIGHT' else self.repeat - ind
-        v = value / self.repeat
-        ease_in = self.op.interp_ease_in
-        ease_out = self.op.interp_ease_out
-        if self.op.interp_ease == 'INOUT':  # Ease In/Out
-            x = (1 - v) * ease_in + v * ease_out if v <= 0.5 else v * ease_in + (1 - v) * ease_out
-        elif self.op.interp_ease == 'IN':  # Ease In
-            x = (1 - v) * ease_in + v * ease_out
-        else:  # Ease Out
-            x = v * ease_in + (1 - v) * ease_out
-        val_min = getattr(self.op, props[0])
-        val_max = getattr(self.op, props[1])
-        try:
-            len(val_min)
-            if self.op.value_sync and len(props) > 2:
-                x_norm = map_range(x, 0, 1, val_min[0], val_max[0])
-                if type(val_min[0]) == int:
-                    x_norm = int(x_norm)
-                return x_norm, x_norm, x_norm
-            else:
-                minx, miny, minz = val_min
-                maxx, maxy, maxz = val_max
-
-                x_norm = map_range(x, 0, 1, minx, maxx)
-                y_norm = map_range(x, 0, 1, miny, maxy)
-                z_norm = map_range(x, 0, 1, minz, maxz)
+        val_min, val_max = self.bounds[props]
+        vector = type(val_min) == tuple
+        if vector and self.value_sync and len(props) > 2:
+            val_min, val_max = (val_min[0],) * len(val_min), (val_max[0],) * len(val_max)
+        integer = type(val_min[0] if vector else val_min) == int
+        return self.__values(self.factors[:, None], val_min, val_max, vector, integer)
 
-                if type(val_min[0]) == int:
-                    x_norm = int(x_norm)
-                    y_norm = int(y_norm)
-                    z_norm = int(z_norm)
-                return x_norm, y_norm, z_norm
-
-        except TypeError:
-            x_norm = map_range(x, 0, 1, val_min, val_max)
-            if type(val_min) == int:
-                x_norm = int(x_norm)
-            return x_norm
+    @staticmethod
+    def __values(factors: np.ndarray, val_min: Union[float, int, Tuple], val_max: Union[float, int, Tuple],
+                 vector: bool, integer: bool) -> np.ndarray:
+        """Map (repeat, components) factors onto the property bounds in a single kernel call into typed storage"""
+        val_min = np.atleast_1d(np.asarray(val_min, dtype=np.float64))
+        val_max = np.atleast_1d(np.asarray(val_max, dtype=np.float64))
+        factors = np.ascontiguousarray(np.broadcast_to(factors, (factors.shape[0], val_min.shape[0])))
+        values = map_range(factors, val_min, val_max)
+        values = values.astype(np.int32 if integer else np.single)  # int32 truncates toward zero like int()
+        return values if vector else values[:, 0]
 
 
 # --------------------------------------------------- SINGLE OPERATOR --------------------------------------------------
@@ -403,9 +411,10 @@ class STACKS_SingleOperator:
         self.repeat = self.stack.repeat  # Number of operator calls during stack execution
         self.stacktype = self.stack.type  # Enum in {'STACK', 'SELECT'}
         self.interptype = self.op.interp_type if self.stacktype == 'STACK' else None  # {'CONSTANT', 'BEZIER', 'RANDOM'}
+        self.propdict = INTERPOLATE.get(optype, {}).get(opfunc)  # None if the Operator has no interpolated values
         self.func = self.__func()
         self.repeatable = self.__repeatable()
-        self.values = STACKS_PropValues(self.op, self.repeat, optype, opfunc)() if self.repeatable else None
+        self.values = STACKS_PropValues(self.op, self.repeat, self.propdict)() if self.repeatable else None
 
     def __call__(self):
         return self.func()
@@ -415,16 +424,11 @@ class STACKS_SingleOperator:
         if self.stacktype == 'SELECT':
             return STACKS_OpExec(stacks_exe.SelectSet(self.context, self.op))
         else:
-            operator = getattr(stacks_exe, f'{self.optype.capitalize()}{self.opfunc.capitalize()}')
-            return STACKS_OpExec(operator(self.context, self.op))
+            return STACKS_OpExec(stacks_exe.OP_DISPATCH[(self.optype, self.opfunc)](self.context, self.op))
 
     def __repeatable(self) -> bool:
         """Return True or False if function is repeatable or not"""
-        return True if self.repeat > 1 \
-                       and self.interptype != 'CONSTANT' \
-                       and self.optype in INTERPOLATE.keys() \
-                       and self.opfunc in INTERPOLATE[self.optype].keys() \
-                       else False
+        return self.repeat > 1 and self.interptype != 'CONSTANT' and self.propdict is not None
 
 
 # ------------------------------------------ SCENE'S SINGLE STACK OF OPERATORS -----------------------------------------
@@ -523,14 +527,15 @@ class STACKS_ExecuteStacks(STACKS_ObjectSetup):
         self.__enable_modifiers()
 
     @property
-    def modifiers(self) -> Dict[Modifier, bool]:
-        """Read-only. Return dict of object modifiers containing their enable status"""
-        return {m: bool(m.show_viewport) for m in self.ob.modifiers}
+    def modifiers(self) -> np.ndarray:
+        """Read-only. Return the object modifiers enable status in the modifiers order"""
+        enabled = np.empty(len(self.ob.modifiers), dtype=bool)
+        self.ob.modifiers.foreach_get('show_viewport', enabled)
+        return enabled
 
     def __enable_modifiers(self, enable=True) -> None:
         """Enable/Disable modifiers according to its initial status"""
-        for m, e in self._modifiers.items():
-            m.show_viewport = e if enable else False
+        self.ob.modifiers.foreach_set('show_viewport', self._modifiers if enable else np.zeros_like(self._modifiers))
 
     @staticmethod
     def dummy(context: Context):
@@ -544,10 +549,11 @@ class STACKS_ExecuteStacks(STACKS_ObjectSetup):
             for i in range(stack.repeat):
                 for f in stack.funcs:
                     if f.repeatable:
+                        op = f.op
                         for v in f.values:
-                            setattr(f.op, v.prop, v.values[i])
-                            self.sc.update_tag()
+                            setattr(op, v.prop, v.values[i])
                     f()
+        self.sc.update_tag()  # only flags the depsgraph, evaluated after the execution: once is enough
         _BPyOpsSubModOp._view_layer_update = vl_update
 
     def restore(self) -> None:
@@ -562,16 +568,22 @@ class STACKS_ExecuteStacks(STACKS_ObjectSetup):
 
     def _stacks(self) -> List[Union[STACKS_Stack, STACKS_StackSelect]]:
         """Return list of STACKS_Stack Classes for each stack"""
+        count = len(self.ob_stacks)
+        if not count:
+            return []
+        enabled = np.empty(count, dtype=bool)
+        self.ob_stacks.foreach_get('enabled', enabled)
+        if not enabled.any():  # nothing to plan, the mesh is only rebuilt from its reference
+            return []
+        stack_index = np.empty(count, dtype=np.int32)
+        self.ob_stacks.foreach_get('stack_index', stack_index)
         stacks = []
-        for ind, stack in enumerate(self.ob_stacks):
-            if stack.enabled:
-                if stack.type == 'SELECT':
-                    st = STACKS_StackSelect(self.context, stack)
-                elif len(self.sc_stacks) <= stack.stack_index:
-                    continue
-                else:
-                    st = STACKS_Stack(self.context, stack, self.sc_stacks)
-                stacks.append(st)
+        for ind, exists in stacks_plan(enabled, stack_index, len(self.sc_stacks)):
+            stack = self.ob_stacks[int(ind)]
+            if stack.type == 'SELECT':
+                stacks.append(STACKS_StackSelect(self.context, stack))
+            elif exists:
+                stacks.append(STACKS_Stack(self.context, stack, self.sc_stacks))
         return stacks
 
     @property
@@ -583,35 +595,117 @@ class STACKS_ExecuteStacks(STACKS_ObjectSetup):
         self.context.object.stacks_common.live_update = enabled
 
 
+# ---------------------------------------------- OBJECT STACKS BACKUPS INDEX -------------------------------------------
+
+def backup_index(ob: Object) -> Set[int]:
+    """Return the scene stacks indices used by the object's stacks backups. Read with one foreach_get per call"""
+    bckups = ob.stacks_c
+    indices = np.empty(len(bckups), dtype=np.int32)
+    bckups.foreach_get("stack_index", indices)
+    return set(indices.tolist())
+
+
 # --------------------------------------- UPDATERS FOR BPY.PROPS ---------------------------------------
 
-def upd_ops(self, context):
-    """Main Mesh Updater on any property change"""
+def upd_ops_execute(self, context):
+    """Main Mesh Updater. Execute Stacks on the active object and objects sharing its stacks"""
     ob = context.object
+    if ob is None:
+        return
     if ob.stacks_common.update_all:
-        STACKS_ExecuteStacks(context)  # Execute Stacks on active object
-        stacks = [stack.stack_index for stack in ob.stacks_c]  # Get active objects stacks
-        active = context.view_layer.objects.active  # remember active object
-        selected = context.selected_objects[:]  # remember selected objects
-        mode = getmode(context)  # remember context mode
-        setmode(context, "OBJECT")  # set object mode
-        bpy.ops.object.select_all(action="DESELECT")  # deselect all objects
-
-        for o in context.view_layer.objects:
-            if o == active or not len([stack for stack in o.stacks_c if stack.stack_index in stacks]):
-                # if object is active (already processed) or if it doesn't have the same stacks as the active one
-                continue
-            if len(o.stacks):
-                context.view_layer.objects.active = o  # set object as active
-                STACKS_ExecuteStacks(context)  # Execute Stacks on object
-        context.view_layer.objects.active = active
-        for o in selected:
-            o.select_set(True)
-        setmode(context, mode)
+        with object_mode(context):  # switch mode once for all the objects, restore it at the end
+            STACKS_ExecuteStacks(context)  # Execute Stacks on active object
+            stacks = backup_index(ob)  # Get active objects stacks
+            active = context.view_layer.objects.active  # remember active object
+            selected = deselect_objects(context)  # deselect all objects, remember the selected ones
+
+            for o in context.view_layer.objects:
+                if o == active or stacks.isdisjoint(backup_index(o)):
+                    # if object is active (already processed) or if it doesn't have the same stacks as the active one
+                    continue
+                if len(o.stacks):
+                    context.view_layer.objects.active = o  # set object as active
+                    STACKS_ExecuteStacks(context)  # Execute Stacks on object
+            context.view_layer.objects.active = active
+            for o in selected:
+                o.select_set(True)
     else:
         STACKS_ExecuteStacks(context)
 
 
+# Operator and UI edits execute synchronously, inside the undo step Blender pushes for them.
+# Only the values set from Python inside upd_ops_batch() are collected and executed once by the timer.
+_upd_ops_armed = False
+_upd_ops_batch = 0  # upd_ops_batch() nesting depth
+_upd_ops_pending: Set[str] = set()  # names of the objects changed since the timer was armed. For upd_ops
+
+
+def _upd_ops_execute_pending(context: Context) -> None:
+    """Execute Stacks on every recorded object still in the view layer, restore the active object at the end"""
+    names = tuple(_upd_ops_pending)
+    _upd_ops_pending.clear()
+    objects = context.view_layer.objects
+    active = objects.active
+    for name in names:
+        ob = bpy.data.objects.get(name)
+        if ob is None or objects.get(ob.name) is None:  # removed or unlinked before the timer fired
+            continue
+        objects.active = ob
+        upd_ops_execute(None, context)
+    objects.active = active
+
+
+def _upd_ops_flush() -> None:
+    """Timer callback executing Stacks once per object for all the property changes since the timer was armed"""
+    global _upd_ops_armed
+    _upd_ops_armed = False
+    context = bpy.context
+    if context.window is None and hasattr(context, 'temp_override'):
+        with context.temp_override(**get_override(context)):
+            _upd_ops_execute_pending(bpy.context)
+    else:  # before Blender 3.2 setmode passes get_override() dict to the operators itself
+        _upd_ops_execute_pending(context)
+    return None
+
+
+def upd_ops_cancel() -> None:
+    """Unregister the armed timer and forget the recorded objects. Call when the file they belong to is unloaded"""
+    global _upd_ops_armed
+    if bpy.app.timers.is_registered(_upd_ops_flush):
+        bpy.app.timers.unregister(_upd_ops_flush)
+    _upd_ops_armed = False
+    _upd_ops_pending.clear()
+
+
+@contextmanager
+def upd_ops_batch():
+    """Collect the property changes made from Python inside the block, execute Stacks once with a short delay"""
+    global _upd_ops_batch
+    _upd_ops_batch += 1
+    try:
+        yield
+    finally:
+        _upd_ops_batch -= 1
+
+
+def upd_ops(self, context):
+    """Main Mesh Updater on any property change. Changes made inside upd_ops_batch() are executed once by timer"""
+    global _upd_ops_armed
+    ob = context.object
+    if ob is None or not ob.stacks_common.live_update:
+        return
+    if not _upd_ops_batch:
+        upd_ops_execute(self, context)
+        return
+    # Scene stacks operators belong to the Scene: the active object is the one they were edited for
+    owner = getattr(self, 'id_data', None)
+    _upd_ops_pending.add(owner.name if isinstance(owner, Object) else ob.name)
+    if _upd_ops_armed:
+        return
+    _upd_ops_armed = True
+    bpy.app.timers.register(_upd_ops_flush, first_interval=UPD_OPS_DELAY)
+
+
 def upd_obj(self, context):
     """Update Object Stack Enum Property"""
     if context.object.stacks_common.live_update:
@@ -620,6 +714,19 @@ def upd_obj(self, context):
             upd_ops(self, context)
 
 
+def upgrade_selection(ob: Object) -> None:
+    """Move selection stored as a string by the previous versions into the selection stack collections"""
+    for stack in ob.stacks_c:
+        selection = stack.get('selection')
+        if selection is None:
+            continue
+        del stack['selection']
+        modes, data = selection.split('|')
+        stack.sel_mode = [m == 'T' for m in modes.split('-')]
+        for collection, indices in zip((stack.sel_verts, stack.sel_edges, stack.sel_faces), data.split('-')):
+            indices_set(collection, [int(i) for i in indices[1:-1].split(',') if i.strip()])
+
+
 def upd_save_preset(self, context):
     """Update Save Preset"""
     sc = context.scene.stacks_common
@@ -657,11 +764,12 @@ def upd_edit_original(self, context):
     Hide Stacks object, make original object editable
     """
     ob = context.object
-    if ob.stacks_common.ob_reference is not None:
+    props = ob.stacks_common
+    ref = props.ob_reference
+    if ref is not None:
         # Edit Original has been just pressed in Stacks object
-        assert ob.stacks_common.edit_reference is True
-        ob.stacks_common.live_update = False
-        ref = ob.stacks_common.ob_reference
+        assert props.edit_reference is True
+        props.live_update = False
         setmode(context, 'OBJECT')
         obj_col_link(ob, ref)
         ob.use_fake_user = True
@@ -670,9 +778,9 @@ def upd_edit_original(self, context):
         obs_swap_names(ob, ref)
         set_active_obj(context, ref)
         setmode(context, 'EDIT')
-    elif ob.stacks_common.ob_stacks is not None:
-        assert ob.stacks_common.edit_reference is False
-        stacksob = ob.stacks_common.ob_stacks
+    elif props.ob_stacks is not None:
+        assert props.edit_reference is False
+        stacksob = props.ob_stacks
         setmode(context, 'OBJECT')
         obj_col_link(ob, stacksob)
         ob.use_fake_user = True
@@ -707,67 +815,88 @@ def upd_show_original(self, context):
 # ----------------------------------------- FRAME CHANGE HANDLER FOR ANIMATION -----------------------------------------
 
 
+_ANIMATED_STACK = re.compile(r'stacks\[(\d+)\]')  # Scene stack index in the animated data path
+_animated_stacks: Dict[Tuple[str, int], Set[int]] = {}  # (Action name, fcurves count): animated scene stacks
+
+
+def animated_stacks(action: Action) -> Set[int]:
+    """Return indices of the scene stacks animated by the action. Rescanned only when its fcurves are added/removed"""
+    key = (action.name, len(action.fcurves))  # pointers change on undo
+    animated = _animated_stacks.get(key)
+    if animated is None:
+        matches = (_ANIMATED_STACK.match(fc.data_path) for fc in action.fcurves)
+        animated = _animated_stacks[key] = {int(m.group(1)) for m in matches if m}
+    return animated
+
+
 def STACKS_frame_change(scene: Scene, context: Context):
     """Main animation function for frame_change handler"""
     sc = context.scene
     # check if any operator is animated
-    if not sc.animation_data or not sc.animation_data.action:
+    anim = sc.animation_data  # read once per frame
+    action = anim.action if anim else None
+    if not action:
         return
-    fcs = [fc.data_path for fc in sc.animation_data.action.fcurves
-           if fc.data_path.startswith('stacks')]
-    if not len(fcs):
+    animated = animated_stacks(action)  # animated scene stacks indices
+    if not animated:
         return
 
     # remember initial context
     vl = context.view_layer
     active_obj = vl.objects.active
-    selected = list(context.selected_objects)
-    mode = getmode(context)
 
     # process objects
-    setmode(context, 'OBJECT')
-    bpy.ops.object.select_all(action='DESELECT')
-    for ob in sc.objects:
-        if not len(ob.stacks_c):
-            continue
-        stack_indices = [f"stacks[{st.stack_index}]" for st in ob.stacks_c]
-        # check if animated scene stack is used in the object stacks
-        stacks = False
-        for ind in stack_indices:
-            for fc in fcs:
-                if fc.startswith(ind):
-                    stacks = True
-                    break
-        if not stacks:
-            continue
-        # process object
-        select = bool(ob.hide_select)
-        viewport = bool(ob.hide_viewport)
-        ob.hide_select = False
-        ob.hide_viewport = False
-        vl.objects.active = ob
-        ob.select_set(True)
-        upd_ops(sc, context)
-        ob.hide_select = select
-        ob.hide_viewport = viewport
-        ob.select_set(False)
-    # restore initial context
-    vl.objects.active = active_obj
-    for ob in selected:
-        ob.select_set(True)
-    setmode(context, mode)
+    with object_mode(context):
+        selected = deselect_objects(context)
+        for ob in sc.objects:
+            if not len(ob.stacks_c):
+                continue
+            # check if animated scene stack is used in the object stacks
+            if animated.isdisjoint(backup_index(ob)):
+                continue
+            # process object
+            select = bool(ob.hide_select)
+            viewport = bool(ob.hide_viewport)
+            ob.hide_select = False
+            ob.hide_viewport = False
+            vl.objects.active = ob
+            ob.select_set(True)
+            upd_ops_execute(sc, context)
+            ob.hide_select = select
+            ob.hide_viewport = viewport
+            ob.select_set(False)
+        # restore initial context
+        vl.objects.active = active_obj
+        for ob in selected:
+            ob.select_set(True)
 
 
 # --------------------------------------------------- RENDER HANDLERS --------------------------------------------------
 
+_scene_handlers: Dict[str, Dict[str, Callable]] = {}  # Scene name: {handler name: function appended to handlers}
+
+
+def scene_handlers(sc: Scene) -> Dict[str, Callable]:
+    """
+    Return animation and render handlers appended for the Scene: 'frame_change', 'render_init', 'render_complete'.
+    Kept for the session only, they are never saved to the blend-file. Keyed by name: pointers change on undo
+    """
+    return _scene_handlers.setdefault(sc.name, {})
+
+
+def scene_handlers_clear() -> None:
+    """Forget handlers and animated stacks of all the Scenes. To be used on blend-file load"""
+    _scene_handlers.clear()
+    _animated_stacks.clear()
+
 
 def STACKS_render_init(scene: Scene, context: Context):
     """To be used in render_init handler. Prevent crashes on original render"""
     sc = context.scene
-    assert sc.stacks_common.render_init_id != ""
-    assert sc.stacks_common.frame_change_id != ""
+    assert 'render_init' in scene_handlers(sc)
+    assert 'frame_change' in scene_handlers(sc)
     assert sc.stacks_common.animatable
-    frame_change = Pointer(int(sc.stacks_common.frame_change_id))
+    frame_change = scene_handlers(sc)['frame_change']
     while frame_change in FrameChange:
         FrameChange.remove(frame_change)
 
@@ -780,17 +909,45 @@ def STACKS_render_complete(scene: Scene, context: Context):
     sc = context.scene
     assert sc.stacks_common.animatable
 
-    def frame_change(sc_: Scene):
-        return STACKS_frame_change(sc_, frame_change.context)
+    def frame_change(sc_: Scene):  # context is read from the closure cell, no function attribute lookup per frame
+        return STACKS_frame_change(sc_, context)
 
-    frame_change.context = context
-    sc.stacks_common.frame_change_id = str(id(frame_change))
-    FrameChange.append(Pointer(int(sc.stacks_common.frame_change_id)))
+    scene_handlers(sc)['frame_change'] = frame_change
+    FrameChange.append(frame_change)
 
 
 # ------------------------------------------- SCENE STACK ITEMS ENUM UPDATE --------------------------------------------
 
 
+_stack_enum_cache: Dict[Tuple[str, ...], List[Tuple[str, str, str, str, int]]] = {}  # stacks names: Enum items
+_stack_enum_kept: List[List[Tuple[str, str, str, str, int]]] = []  # served before the last rebuild, still referenced
+_STACK_ENUM_IDS = tuple(f'{i:03d}' for i in range(1000))  # Object Stack Enum identifiers by scene stack index
+
+
+def stack_enum_id(index: int) -> str:
+    """Return Object Stack Enum item identifier for the scene stack index"""
+    return _STACK_ENUM_IDS[index] if 0 <= index < 1000 else f'{index:03d}'
+
+
+def stack_enum_items(self, context: Context) -> List[Tuple[str, str, str, str, int]]:
+    """Items callback for STACKS_PROP_ObStack `stack` property. Serve cached items for the scene stacks names"""
+    sc = context.scene if context is not None else bpy.context.scene
+    names = tuple(s.name for s in sc.stacks)  # indices match positions, the names define the items
+    items = _stack_enum_cache.get(names)
+    if items is None:
+        items = _stack_enum_cache[names] = EnumStackItems.enum_items(sc)
+    return items
+
+
+def stack_enum_clear() -> None:
+    """
+    Start new cached Enum items. Blender doesn't copy the strings of dynamic Enum items,
+    so the items served so far stay referenced until the next clear
+    """
+    _stack_enum_kept[:] = _stack_enum_cache.values()
+    _stack_enum_cache.clear()
+
+
 class EnumStackItems:
     """
     Updating items for Scene Stacks Enum to be shown in Objects.
@@ -798,32 +955,20 @@ class EnumStackItems:
     """
 
     @staticmethod
-    def _get_enum_items() -> Set[Tuple[str, str, str, str, int], Tuple]:
-        """Generate Enum items for STACKS_PROP_ObStack `stack` property"""
-        stacks = bpy.context.scene.stacks
-        result = set()
-        for s in stacks:
-            result.add((f'{s.index:03d}', s.name, s.name, "DOT", s.index))
-        assert len(result) == len(stacks)
-        result.add((f'{len(stacks):03d}', "None", "None", "BLANK1", len(stacks)))
-        return result
+    def enum_items(sc: Scene) -> List[Tuple[str, str, str, str, int]]:
+        """
+        Return Enum items for STACKS_PROP_ObStack `stack` property ordered by their numbers.
+        Scene stacks indices always match their positions, so the collection order is the items order
+        """
+        stacks = (sc if sc is not None else bpy.context.scene).stacks
+        items = [(stack_enum_id(s.index), s.name, s.name, "DOT", s.index) for s in stacks]
+        items.append((stack_enum_id(len(stacks)), "None", "None", "BLANK1", len(stacks)))
+        return items
 
     @staticmethod
     def update_ob_enum() -> None:
-        """Re-Register EnumProperty used in Objects to select stacks"""
-
-        class STACKS_PROP_ObStack(PropertyGroup):
-            """RE-REGISTERABLE! Object Single Stack"""
-            name: StringProperty(default="Stack")
-            index: IntProperty(default=0)
-            stack: EnumProperty(
-                name="Stack Select",
-                items=EnumStackItems._get_enum_items(),
-                default=f'{len(bpy.context.scene.stacks):03d}',
-                update=upd_obj)
-
-        register_class(STACKS_PROP_ObStack)
-        Object.stacks = CollectionProperty(type=STACKS_PROP_ObStack)
+        """Refresh cached items of the EnumProperty used in Objects to select stacks"""
+        stack_enum_clear()
 
     @staticmethod
     def update_project(op: str = 'ADD', old_index: int = 0) -> None:
@@ -833,16 +978,18 @@ class EnumStackItems:
         op          : operator (enum in {'ADD', 'REMOVE'})
         old_index   : used for remove only to fix indices higher than it
         """
-        for ob in bpy.context.scene.objects:
-            if ob.type == 'MESH':
+        sc = bpy.context.scene
+        names = [s.name for s in sc.stacks]  # read once for all the objects
+        names.append("None")  # the last Enum item: no stack selected
+        with upd_ops_batch():  # every object is executed once for all its stacks
+            for ob in (o for o in sc.objects if o.type == 'MESH' and len(o.stacks)):
                 for trg, src in zip(ob.stacks, ob.stacks_c):
+                    index = src.stack_index
                     if op == 'REMOVE':
-                        if 0 > src.stack_index >= old_index:
-                            src.stack_index -= 1
-                    trg.stack = f'{src.stack_index:03d}'
-                    sc = bpy.context.scene
-                    trg.name = sc.stacks[src.stack_index].name if \
-                        src.stack_index != len(sc.stacks) else "None"
+                        if 0 > index >= old_index:
+                            src.stack_index = index = index - 1
+                    trg.stack = stack_enum_id(index)
+                    trg.name = names[index]
 
     @staticmethod
     def project_stack_add() -> None:
@@ -851,10 +998,11 @@ class EnumStackItems:
         Update Enum property for Objects.
         Update Objects' stack indices for internal and UI classes
         """
-        props = bpy.context.scene.stacks
+        sc = bpy.context.scene
+        props = sc.stacks
         props.add()
         index = len(props) - 1
-        bpy.context.scene.stacks_active = props[index].index = index
+        sc.stacks_active = props[index].index = index
         EnumStackItems.update_ob_enum()
         EnumStackItems.update_project()
 
@@ -865,12 +1013,12 @@ class EnumStackItems:
         Update Enum property for Objects.
         Update Objects' stack indices for internal and UI classes
         """
-        props = bpy.context.scene.stacks
-        old_index = bpy.context.scene.stacks_active
+        sc = bpy.context.scene
+        props = sc.stacks
+        old_index = sc.stacks_active
         props.remove(old_index)
-        for i, ar in enumerate(props):
-            ar.index = i
-        bpy.context.scene.stacks_active = old_index - 1 if old_index else 0
+        indices_renumber(props)
+        sc.stacks_active = old_index - 1 if old_index else 0
         EnumStackItems.update_ob_enum()
         EnumStackItems.update_project(op='REMOVE', old_index=old_index)
 
@@ -879,28 +1027,26 @@ class EnumStackItems:
         """
         Add new Object Stack slot
         """
-        stacks = bpy.context.object.stacks
-        bckups = bpy.context.object.stacks_c
+        ob = bpy.context.object
+        stacks = ob.stacks
+        bckups = ob.stacks_c
         stacks.add()
         bckups.add()
         index = len(stacks) - 1
-        stacks[index].index = bckups[index].index = \
-            bpy.context.object.stacks_active = index
-        bckups[index].stack_index = len(bpy.context.scene.stacks)
+        stacks[index].index = ob.stacks_active = index
+        bckups[index].stack_index = stacks[index]['stack'] = len(bpy.context.scene.stacks)  # "None", no update call
 
     @staticmethod
     def object_stack_remove() -> None:
         """Remove Object Active Stack Slot"""
-        stacks = bpy.context.object.stacks
-        bckups = bpy.context.object.stacks_c
-        old_index = bpy.context.object.stacks_active
+        ob = bpy.context.object
+        stacks = ob.stacks
+        bckups = ob.stacks_c
+        old_index = ob.stacks_active
         stacks.remove(old_index)
         bckups.remove(old_index)
-        for i, ar in enumerate(stacks):
-            ar.index = i
-        for i, ar in enumerate(bckups):
-            ar.index = i
-        bpy.context.object.stacks_active = old_index - 1 if old_index else 0
+        indices_renumber(stacks)
+        ob.stacks_active = old_index - 1 if old_index else 0
         EnumStackItems.update_project()
 
 
@@ -919,11 +1065,43 @@ class EnumStackItemsRegister(EnumStackItems):
 # ------------------------------------------ SLOTS ADD/REMOVE, MOVE UP/DOWN --------------------------------------------
 
 
+@lru_cache(maxsize=256)
+def _prop_list(prop: str) -> Tuple[str, ...]:
+    """Convert prop string into tuple of proper props strings. Parsed once per prop string"""
+    return tuple(PropPathParse.prop_list(prop))
+
+
+def _prop_steps(tokens: Tuple[str, ...]) -> Callable:
+    """Return accessor function walking the parsed props tokens with precompiled attribute and index getters"""
+    steps = tuple(itemgetter(int(t[3:])) if t.startswith('...') else attrgetter(t) for t in tokens)
+    if len(steps) == 1:
+        return steps[0]
+
+    def accessor(source):
+        for step in steps:
+            source = step(source)
+        return source
+    return accessor
+
+
+@lru_cache(maxsize=256)
+def _prop_getter(prop: str) -> Callable:
+    """Return accessor function for the prop path. Built once per prop string"""
+    return _prop_steps(_prop_list(prop))
+
+
+@lru_cache(maxsize=256)
+def _prop_setter(prop: str) -> Tuple[Callable, str]:
+    """Return (accessor function for the parent of the last prop, last prop name). Built once per prop string"""
+    tokens = _prop_list(prop)
+    return _prop_steps(tokens[:-1]), tokens[-1]
+
+
 class PropPathParse:
     """To be used in SlotAdd/SlotRemove Operators with multiple CollectionProperty() hierarchies"""
 
     @staticmethod
-    def __prop_list(prop: str) -> List[str]:
+    def prop_list(prop: str) -> List[str]:
         """Convert prop string into list of proper props strings"""
         splitted = prop.split('.')
         result = []
@@ -948,45 +1126,42 @@ class PropPathParse:
         return result
 
     def get_prop(self, source: Union[Object, Scene], prop: str) -> BlenderRNA:
-        prop_list = self.__prop_list(prop)
-        for p in prop_list:
-            if p.startswith('...'):
-                source = source[int(p[3:])]
-            else:
-                source = getattr(source, p)
-        return source
+        return _prop_getter(prop)(source) if _prop_list(prop) else source
 
     def set_prop(self, source: Union[Object, Scene], prop: str,
                  value: Union[int, float, Vector]) -> None:
-        prop_list = self.__prop_list(prop)
+        prop_list = _prop_list(prop)
         if len(prop_list) == 0:
             return
         elif len(prop_list) == 1:
             setattr(source, prop, value)
         else:
-            num = 0
-            while num < len(prop_list) - 1:
-                if prop_list[num].startswith('...'):
-                    source = source[int(prop_list[num][3:])]
-                else:
-                    source = getattr(source, prop_list[num])
-                num += 1
-            setattr(source, prop_list[-1], value)
+            parent, attr = _prop_setter(prop)
+            source = parent(source)
+            setattr(source, attr, value)
             return source
 
 
 # --------------------------------------------------- SLOT ADD/REMOVE --------------------------------------------------
 
 
+_SLOT_ADD = {  # (source type, collection prop): add function also updating the Scene Stacks Enum
+    (Scene, 'stacks'): EnumStackItems.project_stack_add,
+    (Object, 'stacks'): EnumStackItems.object_stack_add,
+}
+_SLOT_REMOVE = {  # (source type, collection prop): remove function also updating the Scene Stacks Enum
+    (Scene, 'stacks'): EnumStackItems.project_stack_remove,
+    (Object, 'stacks'): EnumStackItems.object_stack_remove,
+}
+
+
 class STACKS_SlotAdd(PropPathParse, EnumStackItems):
     """Slot Add"""
 
     def __init__(self, src: str, prop: str, active: str):
-        if type(src) == Scene and prop == 'stacks':
-            self.project_stack_add()
-            return
-        elif type(src) == Object and prop == 'stacks':
-            self.object_stack_add()
+        stack_add = _SLOT_ADD.get((type(src), prop))
+        if stack_add is not None:
+            stack_add()
             return
         props = self.get_prop(src, prop)
         props.add()
@@ -999,17 +1174,14 @@ class STACKS_SlotRemove(PropPathParse, EnumStackItems):
     """Slot Remove"""
 
     def __init__(self, src: str, prop: str, active: str):
-        if type(src) == Scene and prop == 'stacks':
-            self.project_stack_remove()
-            return
-        elif type(src) == Object and prop == 'stacks':
-            self.object_stack_remove()
+        stack_remove = _SLOT_REMOVE.get((type(src), prop))
+        if stack_remove is not None:
+            stack_remove()
             return
         index = self.get_prop(src, active)
         props = self.get_prop(src, prop)
         props.remove(index)
-        for i, ar in enumerate(props):
-            ar.index = i
+        indices_renumber(props)
         new_index = index - 1 if index else 0
         self.set_prop(src, active, new_index)
 
@@ -1029,7 +1201,9 @@ class STACKS_OpsSlotMove(PropPathParse, EnumStackItems):
         elif not direction and active < len(stack.ops) - 1:
             stack.ops.move(active, active + 1)
             stack.ops_active += 1
-        EnumStackItemsRegister()
+        else:
+            return
+        upd_ops_execute(None, context)  # scene stacks names and count are unchanged, only re-execute with new order
 
 
 class STACKS_ObSlotMove(PropPathParse, EnumStackItems):
@@ -1041,19 +1215,13 @@ class STACKS_ObSlotMove(PropPathParse, EnumStackItems):
         stack_c = ob.stacks_c
         active = ob.stacks_active
         if direction and active > 0:
-            stack.move(active, active - 1)
-            stack[active].index, stack[active - 1].index = \
-                stack[active - 1].index, stack[active].index
-            stack_c.move(active, active - 1)
-            stack_c[active].index, stack_c[active - 1].index = \
-                stack_c[active - 1].index, stack_c[active].index
-
-            ob.stacks_active -= 1
+            other = active - 1
         elif not direction and active < len(stack) - 1:
-            stack.move(active, active + 1)
-            stack[active].index, stack[active + 1].index = \
-                stack[active + 1].index, stack[active].index
-            stack_c.move(active, active + 1)
-            stack_c[active].index, stack_c[active + 1].index = \
-                stack_c[active + 1].index, stack_c[active].index
-            ob.stacks_active += 1
+            other = active + 1
+        else:
+            other = None
+        if other is not None:
+            stack.move(active, other)
+            stack_c.move(active, other)
+            stack[active].index, stack[other].index = active, other  # index is the slot position
+            ob.stacks_active = other
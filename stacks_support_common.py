@@ -23,7 +23,9 @@
 """Blender «Stacks» add-on mixins"""
 
 import bpy
-from bpy.types import Context, Object, Scene
+import numpy as np
+from contextlib import contextmanager
+from bpy.types import Context, Object, Scene, bpy_prop_collection
 
 MODES = {
     'EDIT': 'EDIT_MESH',
@@ -33,84 +35,116 @@ MODES = {
     'WEIGHT_PAINT': 'PAINT_WEIGHT',
     'TEXTURE_PAINT': 'PAINT_TEXTURE',
 }
+CONTEXT_MODES = {v: k for k, v in MODES.items()}  # context.mode: mode_set mode
 
-
-def map_range(value, oldmin, oldmax, newmin, newmax):
-    assert oldmax - oldmin != 0
-    return (value - oldmin) * (newmax - newmin) / (oldmax - oldmin) + newmin
+FOREACH_DTYPES = {  # numpy dtypes matching RNA property types for foreach_get/foreach_set memcpy path
+    'BOOLEAN': bool,
+    'INT': np.int32,
+    'FLOAT': np.single,
+}
 
 
 def setmode(context: Context, mode: str) -> None:
     """Set context Blender mode to mode arg."""
-    if context.mode in MODES.values():
-        if not context.mode == MODES[mode]:
-            bpy.ops.object.mode_set(mode=mode)
-    elif not context.mode == mode:
+    if context.mode == MODES.get(mode, mode):
+        return
+    if context.window is None and not hasattr(context, 'temp_override'):  # timers before Blender 3.2
+        bpy.ops.object.mode_set(get_override(context), mode=mode)
+    else:
         bpy.ops.object.mode_set(mode=mode)
 
 
 def getmode(context: Context) -> str:
     """Return proper context mode to be set later"""
-    if context.mode == 'EDIT_MESH':
-        return 'EDIT'
-    elif context.mode == 'PAINT_VERTEX':
-        return 'VERTEX_PAINT'
-    elif context.mode == 'PAINT_WEIGHT':
-        return 'WEIGHT_PAINT'
-    elif context.mode == 'PAINT_TEXTURE':
-        return 'TEXTURE_PAINT'
-    else:
-        return context.mode
+    mode = context.mode
+    return CONTEXT_MODES.get(mode, mode)
+
+
+@contextmanager
+def object_mode(context: Context):
+    """Switch to OBJECT mode once for the whole block, restore the initial context mode after it"""
+    mode = getmode(context)
+    setmode(context, 'OBJECT')
+    try:
+        yield mode
+    finally:
+        setmode(context, mode)
+
+
+def deselect_objects(context: Context) -> list:
+    """
+    Deselect the view layer objects without the select_all Operator call and its view layer update.
+    Return the deselected objects to restore the selection from, no separate copy of it is needed
+    """
+    selected = context.selected_objects
+    for ob in selected:
+        ob.select_set(False)
+    return selected
+
+
+_setattr_missing = set()  # (RNA type, attribute) failed with AttributeError: missing or read-only for the type
 
 
 def setattr_protected(trg, atr, src) -> None:
+    key = (type(trg), atr)
+    if key in _setattr_missing:
+        return
     try:
         setattr(trg, atr, getattr(src, atr))
-    except TypeError:
-        return
-    except RuntimeError:
-        return
     except AttributeError:
+        _setattr_missing.add(key)
+    except (TypeError, RuntimeError):  # depend on the value, may succeed next time
         return
 
 
-def set_selection(context: Context, sel: str = ""):
-    """
-    sel = "T-T-F|0,1,2-0,1,2-0,1,2"
-           v e f|verts edges faces
-           SMode| Element indices
-    """
-    setmode(context, 'EDIT')
-    bpy.ops.mesh.select_all(action='DESELECT')
-    if not sel:
-        return
-    data = sel.split('|')
-    modes = data[0].split('-')
-    mode = (True if modes[0] == 'T' else False,
-            True if modes[1] == 'T' else False,
-            True if modes[2] == 'T' else False)
-    context.tool_settings.mesh_select_mode = mode
-    setmode(context, 'OBJECT')
+_writable_props = {}  # RNA type identifier: writable property names. For writable_props
+
+
+def writable_props(data: bpy.types.bpy_struct) -> tuple:
+    """Return names of the writable RNA properties of the data type, read from RNA once per type"""
+    names = _writable_props.get(data.bl_rna.identifier)
+    if names is None:
+        names = _writable_props[data.bl_rna.identifier] = tuple(
+            p.identifier for p in data.bl_rna.properties if not p.is_readonly)
+    return names
+
+
+def indices_get(collection: bpy_prop_collection) -> np.ndarray:
+    """Return stored mesh elements indices as numpy array"""
+    indices = np.empty(len(collection), dtype=np.int32)
+    collection.foreach_get("value", indices)
+    return indices
+
+
+def indices_renumber(collection: bpy_prop_collection) -> None:
+    """Set `index` of every collection item to its position in one foreach_set call"""
+    collection.foreach_set("index", np.arange(len(collection), dtype=np.int32))
+
+
+def indices_set(collection: bpy_prop_collection, indices: np.ndarray) -> None:
+    """Store mesh elements indices into the collection of STACKS_PROP_Index"""
+    collection.clear()
+    for _ in range(len(indices)):
+        collection.add()
+    collection.foreach_set("value", np.asarray(indices, dtype=np.int32))
+
+
+def edges_unpack(blob: str) -> np.ndarray:
+    """Return edges indices packed into the string by edges_pack"""
+    return np.frombuffer(bytes.fromhex(blob), dtype=np.int32)
+
 
-    mesh = context.object.data
-    mesh_data = data[1].split('-')
-    verts = [int(v) for v in mesh_data[0].split(',')]
-    edges = [int(v) for v in mesh_data[1].split(',')]
-    faces = [int(v) for v in mesh_data[2].split(',')]
-    for v in verts:
-        mesh.vertices[v].select = True
-    for e in edges:
-        mesh.edges[e].select = True
-    for f in faces:
-        mesh.polygons[f].select = True
+def edges_pack(edges: np.ndarray) -> str:
+    """Pack edges indices into the string property value. Hex keeps zero bytes out of the Blender C string"""
+    return np.asarray(edges, dtype=np.int32).tobytes().hex()
 
 
 def get_override(context, area_t: str = 'VIEW_3D',
                  region_t: str = 'WINDOW') -> dict:
-    win = context.window
+    win = context.window if context.window is not None else context.window_manager.windows[0]
     screen = win.screen
-    area = [a for a in screen.areas if a.type == area_t][0]
-    region = [r for r in area.regions if r.type == region_t][0]
+    area = next(a for a in screen.areas if a.type == area_t)  # stop at the first match
+    region = next(r for r in area.regions if r.type == region_t)
     scene = context.scene
     override = {'window': win,
                 'screen': screen,
@@ -121,27 +155,19 @@ def get_override(context, area_t: str = 'VIEW_3D',
 
 
 def obj_col_link(src: Object, trg: Object) -> None:
-    """Link trg object to src object's collections"""
-    for c in bpy.data.collections:
-        if trg.name in c.objects:
-            c.objects.unlink(trg)
-        if src.name in c.objects:
-            c.objects.link(trg)
-    for sc in bpy.data.scenes:
-        if trg.name in sc.collection.objects:
-            sc.collection.objects.unlink(trg)
-        if src.name in sc.collection.objects:
-            sc.collection.objects.link(trg)
+    """Link trg object to src object's collections. Collections shared by both objects are left untouched"""
+    src_cols = set(src.users_collection)  # scenes master collections included
+    trg_cols = set(trg.users_collection)
+    for c in trg_cols - src_cols:
+        c.objects.unlink(trg)
+    for c in src_cols - trg_cols:
+        c.objects.link(trg)
 
 
 def obj_unlink(trg: Object) -> None:
     """Unlink trg Object from all collections and scenes"""
-    for c in bpy.data.collections:
-        if trg.name in c.objects:
-            c.objects.unlink(trg)
-    for sc in bpy.data.scenes:
-        if trg.name in sc.collection.objects:
-            sc.collection.objects.unlink(trg)
+    for c in tuple(trg.users_collection):  # scenes master collections included
+        c.objects.unlink(trg)
 
 
 def obs_swap_names(ob1: Object, ob2: Object) -> None:
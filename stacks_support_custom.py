@@ -24,18 +24,22 @@
 
 from __future__ import annotations
 import bpy
-from bpy.types import Object, MeshVertices, Context, Operator, MeshEdges, MeshPolygons
+import bmesh
+from bpy.types import Object, MeshVertices, Context, Operator, MeshEdges, MeshLoops
 from mathutils import Vector, Matrix
 import numpy as np
-from typing import Union
+from typing import Union, Tuple, Optional
 
 if __name__ == '__main__':
     try:  # PyCharm import
-        from stacks_support_common import setmode, getmode
+        from stacks_support_common import setmode, getmode, writable_props, setattr_protected
+        from stacks_kernels import sphere_mask
     except ModuleNotFoundError:  # Blender Text Editor import
-        from stacks.stacks_support_common import setmode, getmode
+        from stacks.stacks_support_common import setmode, getmode, writable_props, setattr_protected
+        from stacks.stacks_kernels import sphere_mask
 else:  # Add-on import
-    from .stacks_support_common import setmode, getmode
+    from .stacks_support_common import setmode, getmode, writable_props, setattr_protected
+    from .stacks_kernels import sphere_mask
 
 
 class STACKS_CUSTOM_Select_Vertices:
@@ -78,9 +82,9 @@ class STACKS_CUSTOM_Select_Vertices:
         if not self.clear_previous_selection:
             selected = self.__fix_selected(selected, already_selected, self.deselect)
         # print(f"Selected: {selected}")
-        self.verts.foreach_set("select", selected)
+        if selected.any():  # vertices are already deselected by __deselect_all
+            self.verts.foreach_set("select", selected)
         setmode(self.context, "EDIT")
-        self.context.tool_settings.mesh_select_mode = (True, False, False)
         self.context.tool_settings.mesh_select_mode = (
             self.op.sel_mode_verts,
             self.op.sel_mode_edges,
@@ -88,33 +92,25 @@ class STACKS_CUSTOM_Select_Vertices:
         )
 
     def __already_selected(self) -> np.ndarray:
+        """Return vertices selection. Edges and faces selection follows vertices in __fix_selected result"""
         verts = np.empty(len(self.verts), dtype=bool)
         self.verts.foreach_get("select", verts)
-        edges = np.empty(len(self.edges), dtype=bool)
-        self.edges.foreach_get("select", edges)
-        faces = np.empty(len(self.faces), dtype=bool)
-        self.faces.foreach_get("select", faces)
-        return verts, edges, faces
+        return verts
 
     def __deselect_all(self) -> None:
-        verts = np.empty(len(self.verts), dtype=bool)
-        verts.fill(False)
-        self.verts.foreach_set("select", verts)
-        edges = np.empty(len(self.edges), dtype=bool)
-        edges.fill(False)
-        self.edges.foreach_set("select", edges)
-        faces = np.empty(len(self.faces), dtype=bool)
-        faces.fill(False)
-        self.faces.foreach_set("select", faces)
+        elements = (self.verts, self.edges, self.faces)
+        zeros = np.zeros(max(len(e) for e in elements), dtype=bool)  # one buffer shared by all the element types
+        for e in elements:
+            e.foreach_set("select", zeros[:len(e)])
 
     @staticmethod
     def __fix_selected(selected: np.ndarray, already_selected: np.ndarray, deselect: bool):
-        """Sum or subtract new selection from already selected"""
+        """Sum or subtract new selection from already selected. Computed in place of the new selection"""
         if deselect:
-            selected = np.logical_not(selected)
-            return np.logical_and(already_selected[0], selected)
+            np.logical_not(selected, out=selected)
+            return np.logical_and(already_selected, selected, out=selected)
         else:
-            return np.logical_or(already_selected[0], selected)
+            return np.logical_or(already_selected, selected, out=selected)
 
     def __get_selected_indices(self) -> np.ndarray:
         """Get indices of vertices that are meant to be selected"""
@@ -125,8 +121,7 @@ class STACKS_CUSTOM_Select_Vertices:
         elif self.vert_type == "FACENUM":
             selected = STACKS_CUSTOM_Select_VertsByFaces(self)
         else:
-            def selected():
-                return []
+            return np.zeros(len(self.verts), dtype=bool)
         return selected()
 
 
@@ -152,13 +147,14 @@ class STACKS_CUSTOM_Select_Centered:
         """
         assert self.op.vert_type in {"BELOW", "ABOVE", "SPHERE"}
         center = self.__get_center()
-        verts = self.__get_verts_co()
         if self.op.vert_type in {"BELOW", "ABOVE"}:
-            direction = {"BELOW": np.less, "ABOVE": np.greater}[self.op.vert_type]
+            direction = np.less if self.op.vert_type == "BELOW" else np.greater
             axis = {"X": 0, "Y": 1, "Z": 2}[self.op.axis]
-            selected = self.__select_by_axis(center, verts, axis, direction, self.op.noise_threshold,
-                                             self.op.noise_seed, self.op.noise_scale, self.op.noise_falloff)
+            selected = self.__select_by_axis(center, self.__get_axis_co(axis), axis, direction,
+                                             self.op.noise_threshold, self.op.noise_seed, self.op.noise_scale,
+                                             self.op.noise_falloff)
         elif self.op.vert_type == "SPHERE":
+            verts = self.__get_verts_co()
             selected = self.__select_sphere(center, verts, self.op.sphere_size, self.op.noise_threshold,
                                             self.op.noise_seed, self.op.noise_scale, self.op.noise_falloff)
         else:
@@ -176,37 +172,57 @@ class STACKS_CUSTOM_Select_Centered:
             raise NotImplementedError
         return center
 
-    def __get_verts_co(self) -> np.ndarray:
-        """Return numpy array with object vertices coordinates considering orientation"""
-        verts = self.__verts_np(self.op.verts)
+    def __transform(self) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        Return (Rotation and Scale 3x3 matrix, Location offset) to apply to local coordinates, None if identity.
+        Composed in mathutils and converted to float32 numpy arrays once: rows of the matrix map to the axes
+        """
+        matrix = self.op.ob.matrix_world
         if self.op.pivot == "MANUAL":
-            if self.op.orientation == "GLOBAL":
-                self.__vectors_transpose(verts, self.op.ob.matrix_world)
-                self.__vectors_translate(verts, self.op.ob.matrix_world)
+            if self.op.orientation != "GLOBAL":
+                return None, None
+            rotation = matrix.to_3x3()
         elif self.op.pivot == "OBJECT":
-            self.__vectors_transpose(verts, self.op.ob.matrix_world)
+            rotation = matrix.to_3x3()
             if self.op.orientation == "LOCAL":
-                self.__vectors_transpose(verts, self.op.target.matrix_world.inverted())
-            self.__vectors_translate(verts, self.op.ob.matrix_world)
+                rotation = self.op.target.matrix_world.inverted().to_3x3() @ rotation
         else:
             print(f"{self.op.pivot} pivot point is not implemented")
             raise NotImplementedError
+        return np.array(rotation, dtype=np.float32), np.array(matrix.translation, dtype=np.float32)
+
+    def __get_verts_co(self) -> np.ndarray:
+        """Return numpy array with object vertices coordinates considering orientation"""
+        verts = self.__verts_np(self.op.verts)
+        rotation, offset = self.__transform()
+        if rotation is not None:
+            verts = np.matmul(verts, rotation.T)
+            verts += offset
         return verts
 
+    def __get_axis_co(self, axis: int) -> np.ndarray:
+        """Return numpy array with the single axis coordinate of the vertices considering orientation"""
+        verts = self.__verts_np(self.op.verts)
+        rotation, offset = self.__transform()
+        if rotation is None:
+            return np.ascontiguousarray(verts[:, axis])
+        # one row of the matrix is enough for one axis: a dot product per vertex instead of the full matmul
+        return np.matmul(verts, rotation[axis]) + offset[axis]
+
     @staticmethod
-    def __select_by_axis(center: Vector, verts: np.ndarray, axis: int, compare: Union[np.less, np.greater],
+    def __select_by_axis(center: Vector, coords: np.ndarray, axis: int, compare: Union[np.less, np.greater],
                          threshold: float, seed: int, scale: float, falloff: float) -> np.ndarray:
         """
         TODO: Implement Randomness
 
         :param center: mathutils.Vector, selection boarder
-        :param verts: numpy array of 3D vertices coordinates
-        :param axis: index of column
+        :param coords: numpy array of the vertices coordinates along the axis
+        :param axis: index of the center coordinate
         :param compare: np.less or np.greater - function to compare 2 algorithms
         :param threshold: distance around the center to select vertices randomly
         :param threshold:
         """
-        selected = compare(verts[:, axis], center[axis])
+        selected = compare(coords, center[axis])
         if threshold > 0:
             pass
             # msg = "Selection blurring is not implemented yet"
@@ -224,49 +240,18 @@ class STACKS_CUSTOM_Select_Centered:
         :param compare: np.less or np.greater - function to compare 2 algorithms
         :param threshold: distance around the center to select vertices randomly
         """
-        distances = self.__distances(verts, center)
         if threshold > 0:
             msg = "Selection blurring is not implemented yet"
             bpy.ops.stacks.warning('INVOKE_DEFAULT', msg=msg, type="ERROR")
-        return np.less(distances, sphere_size)
-
-    @staticmethod
-    def __distances(verts: np.ndarray, center: Vector) -> np.ndarray:
-        """Return np array with distances from center to each vert"""
-        vectors = verts-center
-        return np.sqrt(np.einsum('ij,ij->i', vectors, vectors))
+        return sphere_mask(verts, np.array(center, dtype=verts.dtype), sphere_size)
 
     @staticmethod
     def __verts_np(vertices: MeshVertices) -> np.ndarray:
         """Return vertices local coordinates as numpy array"""
         assert len(vertices)
-        placeholder = np.zeros([len(vertices)*3], dtype="f")
-        vertices.foreach_get("co", placeholder)
-        verts = np.zeros([len(vertices), 3], dtype="f")
-        verts[:, 0] = placeholder[0::3]
-        verts[:, 1] = placeholder[1::3]
-        verts[:, 2] = placeholder[2::3]
-        return verts
-
-    @staticmethod
-    def __vectors_transpose(vectors: np.ndarray, matrix: Matrix) -> None:
-        """
-        Apply Rotation and Scale matrix to list of vectors
-
-        :param vectors: numpy array with 3d vertex coordinates
-        :param matrix: 4x4 object transformations mathutils.Matrix
-        """
-        vectors[:] = np.matmul(vectors, matrix.to_3x3().transposed())[:]
-
-    @staticmethod
-    def __vectors_translate(vectors: np.ndarray, matrix: Matrix) -> None:
-        """
-        Apply Location offset to list of vectors
-
-        :param vectors: numpy array with 3d vertex coordinates
-        :param matrix: 4x4 object transformations mathutils.Matrix
-        """
-        vectors[:] += matrix.translation
+        verts = np.empty(len(vertices) * 3, dtype=np.float32)
+        vertices.foreach_get("co", verts)
+        return verts.reshape(-1, 3)  # view on the flat buffer, no per-axis copies
 
 
 class STACKS_CUSTOM_Select_VertsByEdges:
@@ -280,25 +265,19 @@ class STACKS_CUSTOM_Select_VertsByEdges:
 
     def __by_edgenum(self) -> np.array:
         """Return a list of indices of vertices that should be selected"""
-        vert_indices = self.__verts_indices(self.op.verts)
         used_in_edges = self.__verts_edge_indices(self.op.edges)
-        unique, count_num = np.unique(used_in_edges, return_counts=True)
-        compare = {False: np.less, True: np.greater_equal}[self.op.more_than]
-        after_threshold = compare(count_num, self.op.edgenum)
-        filtered = unique[after_threshold]
-        return np.isin(vert_indices, filtered)
-
-    @staticmethod
-    def __verts_indices(verts: MeshVertices) -> np.ndarray:
-        """Numpy array with all vertices indices"""
-        vert_indices = np.empty(len(verts), dtype=int)
-        verts.foreach_get("index", vert_indices)
-        return vert_indices
+        count_num = np.bincount(used_in_edges, minlength=len(self.op.verts))  # edges number by vertex index
+        if self.op.more_than:
+            after_threshold = count_num >= self.op.edgenum
+        else:
+            after_threshold = count_num < self.op.edgenum
+        after_threshold &= count_num > 0  # loose vertices never selected
+        return after_threshold  # vertex indices are the array positions
 
     @staticmethod
     def __verts_edge_indices(edges: MeshEdges) -> np.ndarray:
         """Numpy array with all edge vertices indices in mesh"""
-        edge_vert_indices = np.empty(len(edges)*2, dtype=int)
+        edge_vert_indices = np.empty(len(edges)*2, dtype=np.int32)
         edges.foreach_get("vertices", edge_vert_indices)
         return edge_vert_indices
 
@@ -314,29 +293,20 @@ class STACKS_CUSTOM_Select_VertsByFaces:
 
     def __by_facenum(self) -> np.array:
         """Return a list of indices of vertices that should be selected"""
-        vert_indices = self.__verts_indices(self.op.verts)
-        all_faces_verts_indices = self.__verts_face_indices(self.op.faces)
-        unique, count_num = np.unique(all_faces_verts_indices, return_counts=True)
-        compare = {False: np.less, True: np.greater_equal}[self.op.more_than]
-        after_threshold = compare(count_num, self.op.facenum)
-        filtered = unique[after_threshold]
-        selected = np.isin(vert_indices, filtered)
-        return selected
-
-    @staticmethod
-    def __verts_indices(verts: MeshVertices) -> np.ndarray:
-        """Numpy array with all vertices indices"""
-        vert_indices = np.empty(len(verts), dtype=int)
-        verts.foreach_get("index", vert_indices)
-        return vert_indices
+        all_faces_verts_indices = self.__verts_face_indices(self.op.ob.data.loops)
+        count_num = np.bincount(all_faces_verts_indices, minlength=len(self.op.verts))  # faces number by vertex index
+        if self.op.more_than:
+            after_threshold = count_num >= self.op.facenum
+        else:
+            after_threshold = count_num < self.op.facenum
+        after_threshold &= count_num > 0  # vertices without faces never selected
+        return after_threshold  # vertex indices are the array positions
 
     @staticmethod
-    def __verts_face_indices(faces: MeshPolygons) -> np.ndarray:
-        """Numpy array with all edge vertices indices in mesh"""
-        faces_verts_nums = np.empty(len(faces), dtype=int)
-        faces.foreach_get("loop_total", faces_verts_nums)  # Array with number of vertices for each face
-        all_faces_verts_indices = np.empty(np.sum(faces_verts_nums), dtype=int)
-        faces.foreach_get("vertices", all_faces_verts_indices)  # Array with all vertices indices in all faces
+    def __verts_face_indices(loops: MeshLoops) -> np.ndarray:
+        """Numpy array with all face vertices indices in mesh. Mesh loops are the faces corners, sized without a sum"""
+        all_faces_verts_indices = np.empty(len(loops), dtype=np.int32)
+        loops.foreach_get("vertex_index", all_faces_verts_indices)
         return all_faces_verts_indices
 
 
@@ -377,20 +347,46 @@ class STACKS_CUSTOM_Boolean:
         if op.subject == "OBJECT" and self.object is None:
             return
         if op.subject == "SELECTION":
-            self.object = self.__ob_from_selection(self.context, self.ob)
+            self.object = self.__ob_from_selection(self.ob)
         self.__boolean()
         setmode(context, mode)
 
     @staticmethod
-    def __ob_from_selection(context: Context, ob: Object):
-        selected = context.selected_objects[:]
-        bpy.ops.object.select_all(action="DESELECT")
-        setmode(context, "EDIT")
-        bpy.ops.mesh.separate(type="SELECTED")
-        setmode(context, "OBJECT")
-        obj = [o for o in context.selected_objects if o != ob][0]
-        for ob in selected:
-            ob.select_set(True)
+    def __ob_from_selection(ob: Object) -> Object:
+        """
+        Separate selected geometry to the new object the way mesh.separate(type="SELECTED") does, with bmesh
+        in Object Mode: no operator call, undo push and Edit Mode toggling
+        """
+        ob.update_from_editmode()  # the mesh datablock doesn't have the edit-mesh changes until flushed
+        bm = bmesh.new()
+        bm.from_mesh(ob.data)
+        part = bm.copy()
+        bmesh.ops.delete(part, geom=[v for v in part.verts if not v.select], context='VERTS')
+        bmesh.ops.delete(bm, geom=[f for f in bm.faces if f.select], context='FACES_ONLY')
+        bmesh.ops.delete(bm, geom=[e for e in bm.edges if e.select and not e.link_faces], context='EDGES')
+        bmesh.ops.delete(bm, geom=[v for v in bm.verts if v.select and not v.link_edges], context='VERTS')
+        mesh = bpy.data.meshes.new(ob.data.name)
+        part.to_mesh(mesh)
+        bm.to_mesh(ob.data)
+        part.free()
+        bm.free()
+        for mat in ob.data.materials:
+            mesh.materials.append(mat)
+        obj = bpy.data.objects.new(ob.name, mesh)
+        obj.matrix_world = ob.matrix_world
+        for vg in ob.vertex_groups:  # weights are copied with the mesh, group names belong to the object
+            obj.vertex_groups.new(name=vg.name)
+        for sm in ob.modifiers:
+            try:
+                tm = obj.modifiers.new(sm.name, sm.type)
+                for a in writable_props(sm):
+                    setattr_protected(tm, a, sm)
+            except TypeError as exp:
+                print(exp)
+                continue
+        for col in ob.users_collection:
+            col.objects.link(obj)
+        obj.select_set(True)  # separated object is selected along with the source one
         return obj
 
     def __boolean(self):
@@ -22,64 +22,105 @@
 
 """Draw UI of the Blender «Stacks» add-on"""
 
+import bpy
+from functools import lru_cache
 from bpy.types import Panel, ViewLayer, UIList, UILayout, PropertyGroup, Object, Scene
-from bpy.utils import register_class, unregister_class
+from bpy.utils import register_classes_factory
 if __name__ == '__main__':
     try:  # PyCharm import
-        from stacks_constants import INTERPOLATE
+        from stacks_constants import INTERPOLATE, UI_STCK, UI_LIST, UI_TYPE, UI_INTR, UI_SETS, UI_PRESETS
     except ModuleNotFoundError:  # Blender Text Editor import
-        from stacks.stacks_constants import INTERPOLATE
+        from stacks.stacks_constants import INTERPOLATE, UI_STCK, UI_LIST, UI_TYPE, UI_INTR, UI_SETS, UI_PRESETS
 else:  # Add-on import
-    from .stacks_constants import INTERPOLATE
+    from .stacks_constants import INTERPOLATE, UI_STCK, UI_LIST, UI_TYPE, UI_INTR, UI_SETS, UI_PRESETS
+
+_OUTSET_LABELS = ('Less than:', 'More or equal:')  # indexed by the gen_ins_outset bool
+_CHECK_ICON = ('CHECKBOX_DEHLT', 'CHECKBOX_HLT')  # indexed by the enabled bool
+_FOLD_ICON = ('DOWNARROW_HLT', 'RIGHTARROW')  # indexed by the closed bool
+_AXIS_INDEX = {'X': 0, 'Y': 1, 'Z': 2}
+_TORUS_RAD = (('add_tor_rad_maj', 'add_tor_rad_min'),
+              ('add_tor_rad_abso_maj', 'add_tor_rad_abso_min'))  # indexed by the 'EXT_INT' torus mode bool
+_OPS_PROP = {optype: f"ops_{optype.lower()}" for optype in (
+    'SELECT', 'HIDE', 'GENERATE', 'DEFORM', 'TRANSFORM', 'CLEANUP', 'NORMALS', 'ASSIGN', 'ADD', 'FILL')}
+
+
+# --------------------------------------------- COLLAPSIBLE BOXES SUPPORT ----------------------------------------------
+
+
+def closed(sc_common: PropertyGroup, bit: int) -> bool:
+    """Check if the UI box marked with the bit is collapsed"""
+    return bool(sc_common.ui_closed_mask & bit)
+
+
+def closed_toggle(layout: UILayout, sc_common: PropertyGroup, bit: int) -> None:
+    """Draw the arrow collapsing/expanding the UI box marked with the bit"""
+    layout.operator('stacks.ui_toggle', text="", emboss=False,
+                    icon=_FOLD_ICON[closed(sc_common, bit)]).bit = bit
+
+
+def closed_header(col: UILayout, sc_common: PropertyGroup, bit: int, text: str) -> bool:
+    """
+    Draw the header of the UI box marked with the bit, return True if the box is collapsed.
+    Arrow and label are wrapped into columns to align with the box content only when it is expanded
+    """
+    is_closed = closed(sc_common, bit)
+    row = col.row(align=True)
+    layout = row if is_closed else row.column(align=True)
+    layout.operator('stacks.ui_toggle', text="", emboss=False, icon=_FOLD_ICON[is_closed]).bit = bit
+    layout = row if is_closed else row.column(align=True)
+    layout.label(text=text)
+    return is_closed
 
 
 # ----------------------------------------- INTERPOLATED VALUES DRAWING SUPPORT ----------------------------------------
 
 
+@lru_cache(maxsize=None)
+def _prop_names(optype: str, opfunc: str, prop: str, op_type: type) -> tuple:
+    """
+    Return (interpolated property names, syncable, iterable) cached forever: INTERPOLATE is static
+    and iterable is read from the RNA definition of the Operator PropertyGroup class
+    """
+    prop_names = INTERPOLATE[optype][opfunc][prop]
+    iterable = op_type.bl_rna.properties[prop_names[0]].array_length > 0
+    return prop_names, len(prop_names) > 2, iterable
+
+
 def interp(optype: str, opfunc: str, prop: str, col: UILayout, op: PropertyGroup,
            stack_ob: PropertyGroup = None, label: str = "Offset") -> None:
     """To be used in panel drawing function for interpolated parameters"""
-    prop_names = INTERPOLATE[optype][opfunc][prop]
-    syncable = True if len(prop_names) > 2 else False
+    prop_names, syncable, iterable = _prop_names(optype, opfunc, prop, type(op))
     if op.interp_type == 'CONSTANT' or stack_ob.repeat <= 1:
         if syncable:
             col.label(text=label)
             row = col.row(align=True)
             rcol = row.column(align=True)
             if op.value_sync:
-                rcol.prop(op, prop, text="", index=0),
+                rcol.prop(op, prop, text="", index=0)
             else:
-                rcol.prop(op, prop, text=""),
+                rcol.prop(op, prop, text="")
             rcol = row.column(align=True)
             rcol.prop(op, "value_sync", text="", icon="LINKED", toggle=True)
         else:
             col.prop(op, prop, text=label)
     else:
-        try:
-            len(getattr(op, prop_names[0]))
-            iterable = True
-        except TypeError:
-            iterable = False
-
-        # if iterable and syncable and op.value_sync:
+        # repeat > 1 here: both Min and Max are drawn
+        value_sync = iterable and syncable and op.value_sync
+        index = 0 if value_sync else -1
         col.label(text=f"{label}:")
         row = col.row(align=True)
         layout = row.column(align=True) if iterable else row
-        layout.prop(op, prop_names[0],
-                    text="Min",
-                    index=0 if iterable and syncable and op.value_sync else -1)
-        if stack_ob.repeat > 1:
-            layout = row.column(align=True) if iterable else row
-            layout.prop(op, prop_names[1], text="Max",
-                        index=0 if iterable and syncable and op.value_sync else -1)
-            if op.interpolate == 'RANDOM':
-                col.prop(op, "interp_seed", text="Seed")
+        layout.prop(op, prop_names[0], text="Min", index=index)
+        layout = row.column(align=True) if iterable else row
+        layout.prop(op, prop_names[1], text="Max", index=index)
+        if op.interpolate == 'RANDOM':
+            col.prop(op, "interp_seed", text="Seed")
         if iterable and syncable:
             rcol = row.column(align=True)
-            if not op.value_sync:
+            if not value_sync:
                 rrow = rcol.row(align=True)
                 rrow.enabled = False
-                rrow.prop(stack_ob, "dummy", text="", icon="BLANK1", toggle=False, emboss=False)
+                rrow.label(text="", icon="BLANK1")
             rcol.prop(op, "value_sync", text="", icon="LINKED", toggle=True)
 
 
@@ -93,31 +134,32 @@ class STACKS_UL_ObStacks(UIList):
             ob = _context.object
             sc = _context.scene
             stack = ob.stacks_c[item.index]
-            sc_stack = sc.stacks[stack.stack_index] if stack.stack_index < len(sc.stacks) else stack
+            stack_index = stack.stack_index
+            sc_stack = sc.stacks[stack_index] if stack_index < len(sc.stacks) else stack
             if stack.type == 'SELECT':
-                if stack.selection == "f-f-t|[]-[]-[]":
+                if not (len(stack.sel_verts) or len(stack.sel_edges) or len(stack.sel_faces)):
                     row = layout.row()
                     row.alignment = 'CENTER'
                     col = row.column()
                     col.enabled = False
-                    col.prop(stack, "dummy", text="", emboss=True, icon='ERROR')
+                    col.label(text="", icon='ERROR')
                     row.label(text="Selection is Not Set")
                     col = row.column()
                     col.enabled = False
-                    col.prop(stack, "dummy", text="", emboss=True, icon='ERROR')
+                    col.label(text="", icon='ERROR')
                 else:
                     row = layout.row(align=True)
                     row.prop(stack, "name", text="", emboss=False, icon_value=icon)
                     row.prop(
                         stack, "enabled", text="", emboss=False,
-                        icon='CHECKBOX_HLT' if stack.enabled else 'CHECKBOX_DEHLT'
+                        icon=_CHECK_ICON[stack.enabled]
                     )
             else:
                 row = layout.row(align=True)
                 row.prop(sc_stack, "name", text="", emboss=False, icon_value=icon)
                 row.prop(
                     stack, "enabled", text="", emboss=False,
-                    icon='CHECKBOX_HLT' if stack.enabled else 'CHECKBOX_DEHLT'
+                    icon=_CHECK_ICON[stack.enabled]
                 )
         elif self.layout_type == 'GRID':
             layout.alignment = 'CENTER'
@@ -135,7 +177,7 @@ class STACKS_UL_Stacks(UIList):
             row.prop(item, "name", text="", emboss=False, icon_value=icon)
             row.prop(
                 item, "enabled", text="", emboss=False,
-                icon='CHECKBOX_HLT' if item.enabled else 'CHECKBOX_DEHLT'
+                icon=_CHECK_ICON[item.enabled]
             )
         elif self.layout_type == 'GRID':
             layout.alignment = 'CENTER'
@@ -147,10 +189,12 @@ class STACKS_UL_Stacks(UIList):
 
 class STACKS_UI_TopMenu:
     """UI Layout: Panel Top Menu Drawing"""
+    __slots__ = ('ob',)
+
     def __init__(self, ob: Object, col: UILayout, sc_common: PropertyGroup):
-        self.ob = ob
-        if self.ob.stacks_common.ob_stacks is not None:
-            self.ob = self.ob.stacks_common.ob_stacks
+        stacksob = ob.stacks_common.ob_stacks
+        self.ob = ob if stacksob is None else stacksob
+        if stacksob is not None:
             col.label(text="EDITING ORIGINAL", icon='ERROR')
 
         row = col.row(align=True)
@@ -169,12 +213,15 @@ class STACKS_UI_TopMenu:
 
 class STACKS_UI_StackList:
     """UI Layout: Stack List Drawing"""
+    __slots__ = ('interrupt',)
+
     def __init__(self, layout: UILayout, ob: Object):
         self.interrupt = False
+        stacks_count = len(ob.stacks)
         mainrow = layout.row(align=True)
         col = mainrow.column()
         col.template_list("STACKS_UL_ObStacks", "name", ob, "stacks", ob, "stacks_active",
-                          rows=(5 if len(ob.stacks) > 1 else 3) if len(ob.stacks) else 1)
+                          rows=(5 if stacks_count > 1 else 3) if stacks_count else 1)
         ops = mainrow.column(align=True)
         op_add = ops.operator("stacks.slot_add", text="", icon="ADD")
         op_add.prop = "stacks"
@@ -184,10 +231,10 @@ class STACKS_UI_StackList:
         op_rem.prop = "stacks"
         op_rem.active = "stacks_active"
         op_rem.source = "object"
-        if not len(ob.stacks):
+        if not stacks_count:
             self.interrupt = True
             return
-        elif len(ob.stacks) > 1:
+        elif stacks_count > 1:
             ops.separator()
             op_move_up = ops.operator("stacks.slot_ob_move", text="", icon="TRIA_UP")
             op_move_up.direction = True
@@ -228,9 +275,12 @@ class STACKS_UI_SelectMenu:
 
 class STACKS_UI_StackMenu:
     """UI Layout: Stack Menu Drawing"""
-    def __init__(self, layout: UILayout, ob: Object, stack_ob: PropertyGroup, sc_common: PropertyGroup, sc: Scene):
+    __slots__ = ('interrupt', 'active_index', 'stack_sc')
+
+    def __init__(self, layout: UILayout, ob: Object, stack_ob: PropertyGroup, sc_common: PropertyGroup, sc: Scene,
+                 stacks_active: int):
         self.interrupt = False
-        stack, self.active_index, self.stack_sc = self.__active_stack(ob, sc)
+        stack, self.active_index, self.stack_sc = self.__active_stack(ob, sc, stacks_active)
 
         col = layout.column(align=True)
         row = col.row(align=True)
@@ -238,10 +288,9 @@ class STACKS_UI_StackMenu:
         row.prop(ob.stacks_common, "update_all", text='Update All', toggle=True)
 
         row = col.row(align=True)
-        row.prop(sc_common, "op_stck_closed", text="", emboss=False,
-                 icon="RIGHTARROW" if sc_common.op_stck_closed else "DOWNARROW_HLT")
+        closed_toggle(row, sc_common, UI_STCK)
         row.label(text="Stack:")
-        if sc_common.op_stck_closed:
+        if closed(sc_common, UI_STCK):
             return
 
         col.prop(stack_ob, 'type', text='Type')
@@ -266,8 +315,8 @@ class STACKS_UI_StackMenu:
             return self.stack_sc, self.active_index
 
     @staticmethod
-    def __active_stack(ob: Object, sc: Scene):
-        stack = ob.stacks[ob.stacks_active]
+    def __active_stack(ob: Object, sc: Scene, stacks_active: int):
+        stack = ob.stacks[stacks_active]
         active_index = int(stack.stack)
         stack_sc = sc.stacks[active_index] if active_index < len(sc.stacks) else None
         return stack, active_index, stack_sc
@@ -280,10 +329,9 @@ class STACKS_UI_Presets:
     """UI Layout: Presets Menu Drawing"""
     def __init__(self, col: UILayout, sc_common: PropertyGroup):
         row = col.row(align=True)
-        row.prop(sc_common, "presets_closed", text="", emboss=False,
-                 icon="RIGHTARROW" if sc_common.presets_closed else "DOWNARROW_HLT")
+        closed_toggle(row, sc_common, UI_PRESETS)
         row.label(text="Presets:")
-        if sc_common.presets_closed:
+        if closed(sc_common, UI_PRESETS):
             return
 
         col.separator()
@@ -300,7 +348,7 @@ class STACKS_UI_Presets:
         col.separator()
         row = col.row(align=True)
         rspl = row.split(factor=.74, align=True)
-        rspl.prop(sc_common, "save_to", text="")
+        rspl.prop_search(sc_common, "save_to", bpy.data, "texts", text="")
         rspl.operator("stacks.del_text", text="", icon="X")
         rspl.operator("stacks.new_text", text="", icon="FILE_NEW")
         col.prop(sc_common, "overwrite", text="Overwrite")
@@ -309,7 +357,7 @@ class STACKS_UI_Presets:
     @staticmethod
     def __load(col: UILayout, sc_common: PropertyGroup):
         col.separator()
-        col.prop(sc_common, "load_from", text="")
+        col.prop_search(sc_common, "load_from", bpy.data, "texts", text="")
         col.separator()
         col.operator("stacks.preset_load")
 
@@ -322,8 +370,7 @@ class STACKS_UI_OpsList:
     def __init__(self, col: UILayout, stack_ob: PropertyGroup, stack_sc: PropertyGroup,
                  ob: Object, active_index: int, sc_common: PropertyGroup):
 
-        self.__header(col, sc_common)
-        if sc_common.op_list_closed:
+        if closed_header(col, sc_common, UI_LIST, "Stack Operators:"):
             return
 
         self.__repeat(col, stack_ob)
@@ -335,16 +382,6 @@ class STACKS_UI_OpsList:
         if len(stack_sc.ops) > 1:
             self.__slots_move(ops, active_index)
 
-    @staticmethod
-    def __header(col: UILayout, sc_common: PropertyGroup) -> None:
-        """Stack Menu Header"""
-        row = col.row(align=True)
-        rcol1 = row.column(align=True)
-        rcol1.prop(sc_common, "op_list_closed", text="", emboss=False,
-                   icon="RIGHTARROW" if sc_common.op_list_closed else "DOWNARROW_HLT")
-        rcol2 = row.column(align=True)
-        rcol2.label(text="Stack Operators:")
-
     @staticmethod
     def __repeat(col: UILayout, stack_ob) -> None:
         """Repeat Stack Property"""
@@ -360,14 +397,13 @@ class STACKS_UI_OpsList:
     @staticmethod
     def __slots_ops(ops: UILayout, active_index: int) -> None:
         """Add/Remove Slots buttons"""
+        prop_path = f"stacks[{active_index}].ops"
+        active_path = f"{prop_path}_active"
         bop_add = ops.operator("stacks.slot_add", text="", icon="ADD")
-        bop_add.prop = f"stacks[{active_index}].ops"
-        bop_add.active = f"stacks[{active_index}].ops_active"
-        bop_add.source = "scene"
         bop_rem = ops.operator("stacks.slot_remove", text="", icon="REMOVE")
-        bop_rem.prop = f"stacks[{active_index}].ops"
-        bop_rem.active = f"stacks[{active_index}].ops_active"
-        bop_rem.source = "scene"
+        bop_add.prop = bop_rem.prop = prop_path
+        bop_add.active = bop_rem.active = active_path
+        bop_add.source = bop_rem.source = "scene"
 
     @staticmethod
     def __slots_move(ops: UILayout, active_index: int) -> None:
@@ -386,46 +422,18 @@ class STACKS_UI_OpsList:
 class STACKS_UI_OpsType:
     """UI Layout: Operators Type Menu drawing"""
     def __init__(self, col: UILayout, op: PropertyGroup, sc_common: PropertyGroup):
-        self.__header(col, sc_common)
-        if not sc_common.op_type_closed:
+        if not closed_header(col, sc_common, UI_TYPE, "Operator Type:"):
             self.__type(col, op)
 
-    @staticmethod
-    def __header(col: UILayout, sc_common: PropertyGroup) -> None:
-        """Operator Type Menu Header"""
-        row = col.row(align=True)
-        rcol1 = row.column(align=True)
-        rcol1.prop(sc_common, "op_type_closed", text="", emboss=False,
-                   icon="RIGHTARROW" if sc_common.op_type_closed else "DOWNARROW_HLT")
-        rcol2 = row.column(align=True)
-        rcol2.label(text="Operator Type:")
-
     @staticmethod
     def __type(col: UILayout, op: PropertyGroup) -> None:
         """Operator Type Property"""
         box = col.box()
         rcol2 = box.column(align=True)
         rcol2.prop(op, "operator_type")
-        if op.operator_type == 'SELECT':
-            rcol2.prop(op, "ops_select")
-        elif op.operator_type == 'HIDE':
-            rcol2.prop(op, "ops_hide")
-        elif op.operator_type == 'GENERATE':
-            rcol2.prop(op, "ops_generate")
-        elif op.operator_type == 'DEFORM':
-            rcol2.prop(op, "ops_deform")
-        elif op.operator_type == 'TRANSFORM':
-            rcol2.prop(op, "ops_transform")
-        elif op.operator_type == 'CLEANUP':
-            rcol2.prop(op, "ops_cleanup")
-        elif op.operator_type == 'NORMALS':
-            rcol2.prop(op, "ops_normals")
-        elif op.operator_type == 'ASSIGN':
-            rcol2.prop(op, "ops_assign")
-        elif op.operator_type == 'ADD':
-            rcol2.prop(op, "ops_add")
-        elif op.operator_type == 'FILL':
-            rcol2.prop(op, "ops_fill")
+        prop = _OPS_PROP.get(op.operator_type)
+        if prop is not None:
+            rcol2.prop(op, prop)
 
 
 # ---------------------------------------------------- INTERPOLATION ---------------------------------------------------
@@ -437,16 +445,16 @@ class STACKS_UI_Interpolate:
         if not self.__is_valid(op):
             return
 
-        self.__header(col, sc_common)
-        if sc_common.op_intr_closed:
+        if closed_header(col, sc_common, UI_INTR, "Interpolation:"):
             return
 
         box = col.box()
         bcol = box.column(align=True)
         self.__type(bcol, op)
-        if op.interp_type == 'RANDOM':
+        interp_type = op.interp_type
+        if interp_type == 'RANDOM':
             self.__random(bcol, op)
-        elif op.interp_type == "BEZIER":
+        elif interp_type == "BEZIER":
             self.__bezier(bcol, op)
 
     @staticmethod
@@ -454,7 +462,7 @@ class STACKS_UI_Interpolate:
         """Can Operator use interpolation. Return True or False"""
         if op.operator_type == 'NONE':
             return False
-        elif getattr(op, f"ops_{op.operator_type.lower()}") == 'NONE':
+        elif getattr(op, _OPS_PROP[op.operator_type]) == 'NONE':
             return False
         elif op.operator_type in {'HIDE', 'NORMALS', 'ASSIGN'}:
             return False
@@ -462,16 +470,6 @@ class STACKS_UI_Interpolate:
             return False
         return True
 
-    @staticmethod
-    def __header(col: UILayout, sc_common: PropertyGroup) -> None:
-        """Operator Type Menu Header"""
-        row = col.row(align=True)
-        rcol1 = row.column(align=True)
-        rcol1.prop(sc_common, "op_intr_closed", text="", emboss=False,
-                   icon="RIGHTARROW" if sc_common.op_intr_closed else "DOWNARROW_HLT")
-        bcol = row.column(align=True)
-        bcol.label(text="Interpolation:")
-
     @staticmethod
     def __type(col: UILayout, op: PropertyGroup) -> None:
         """Interpolate Type Select Menu"""
@@ -502,43 +500,18 @@ class STACKS_UI_OpSettings:
     def __init__(self, ob: Object, col: UILayout, op: PropertyGroup,
                  sc_common: PropertyGroup, stack_ob: PropertyGroup):
 
-        self.__header(col, sc_common)
-        if sc_common.op_sets_closed:
+        if closed_header(col, sc_common, UI_SETS, "Operator Settings:"):
             return
 
         box = col.box()
         bcol = box.column()
         self.__settings(ob, bcol, op, stack_ob)
 
-    @staticmethod
-    def __header(col: UILayout, sc_common: PropertyGroup) -> None:
-        row = col.row(align=True)
-        rcol1 = row.column(align=True)
-        rcol1.prop(sc_common, "op_sets_closed", text="", emboss=False,
-                   icon="RIGHTARROW" if sc_common.op_sets_closed else "DOWNARROW_HLT")
-        rcol2 = row.column(align=True)
-        rcol2.label(text="Operator Settings:")
-
     @staticmethod
     def __settings(ob: Object, col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup):
-        if op.operator_type == 'SELECT':
-            STACKS_UI_OPS_Select(ob, col, op, stack_ob)
-        elif op.operator_type == 'GENERATE':
-            STACKS_UI_OPS_Generate(col, op, stack_ob)
-        elif op.operator_type == 'DEFORM':
-            STACKS_UI_OPS_Deform(col, op, stack_ob)
-        elif op.operator_type == 'TRANSFORM':
-            STACKS_UI_OPS_Transform(col, op, stack_ob)
-        elif op.operator_type == 'CLEANUP':
-            STACKS_UI_OPS_Cleanup(col, op)
-        elif op.operator_type == 'NORMALS':
-            STACKS_UI_OPS_Normals(col, op)
-        elif op.operator_type == 'ASSIGN':
-            STACKS_UI_OPS_Assign(ob, col, op)
-        elif op.operator_type == 'ADD':
-            STACKS_UI_OPS_Add(col, op, stack_ob)
-        elif op.operator_type == 'FILL':
-            STACKS_UI_OPS_Fill(col, op)
+        settings = _OPS_PANEL.get(op.operator_type)
+        if settings is not None:
+            settings(ob, col, op, stack_ob)
 
 
 # ----------------------------------------------------- OPS SELECT -----------------------------------------------------
@@ -546,6 +519,8 @@ class STACKS_UI_OpSettings:
 
 class STACKS_UI_OPS_Select:
     """UI Layout: Select Operators panels drawing"""
+    __slots__ = ()
+
     def __init__(self, ob: Object, col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup):
         """Select Operator Settings"""
         row = col.row(align=True)
@@ -555,46 +530,45 @@ class STACKS_UI_OPS_Select:
         row.prop(op, 'sel_mode_edges', text="", emboss=True, icon='EDGESEL')
         row.prop(op, 'sel_mode_faces', text="", emboss=True, icon='FACESEL')
 
-        if op.ops_select == 'RANDOM':
-            self.__random(col, op, stack_ob)
-        elif op.ops_select == 'ALL':
-            col.label(text="Select All")
-        elif op.ops_select == 'DESELECT':
-            col.label(text="Deselect All")
-        elif op.ops_select == 'INVERT':
-            col.label(text="Invert Selection")
-        elif op.ops_select == 'LOOSE':
-            col.label(text="Select Loose Geometry")
-        elif op.ops_select == 'NON_MANIFOLD':
-            col.label(text="Select Non-Manifold Geometry")
-        elif op.ops_select == 'BOUNDARY':
-            col.label(text="Select Boundary Loop")
-        elif op.ops_select == 'SHARP':
-            col.prop(op, 'sel_sharp')
-        elif op.ops_select == 'MORE':
-            col.alignment = 'CENTER'
-            col.prop(op, 'sel_more', text="", emboss=True,
-                     icon='ADD' if op.sel_more else 'REMOVE')
-        elif op.ops_select == 'CUSTOM':
-            self.__custom(col, op)
-        elif op.ops_select == 'VGROUP':
-            col.prop(op, "gen_subd_ngon", text="Clear Previous Selection")
-            col.prop(op, "sel_rand_invert", text="Deselect", toggle=True)
-            col.prop_search(op, "sel_vgroup", ob, "vertex_groups", text="Group")
-        elif op.ops_select == 'BYSIDES':
-            col.prop(op, "gen_ins_interp", text="Clear Selection")
-            col.prop(op, "fill_holes", text="Vertices")
-            col.prop(op, "sel_bysides_type")
-            col.prop(op, "gen_subd_ngon", text="Extend")
+        label = self._LABELS.get(op.ops_select)
+        if label is not None:
+            col.label(text=label)
+            return
+        draw = self._DISPATCH.get(op.ops_select)
+        if draw is not None:
+            draw(ob, col, op, stack_ob)
 
     @staticmethod
-    def __random(col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup) -> None:
+    def __random(ob: Object, col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup) -> None:
         col.prop(op, 'sel_rand_invert', text="Invert")
         interp("SELECT", "RANDOM", 'sel_rand_ratio', col, op, stack_ob=stack_ob, label='Ratio')
         interp("SELECT", "RANDOM", 'sel_rand_seed', col, op, stack_ob=stack_ob, label='Seed')
 
     @staticmethod
-    def __custom(col: UILayout, op: PropertyGroup) -> None:
+    def __sharp(ob: Object, col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup) -> None:
+        col.prop(op, 'sel_sharp')
+
+    @staticmethod
+    def __more(ob: Object, col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup) -> None:
+        col.alignment = 'CENTER'
+        col.prop(op, 'sel_more', text="", emboss=True,
+                 icon='ADD' if op.sel_more else 'REMOVE')
+
+    @staticmethod
+    def __vgroup(ob: Object, col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup) -> None:
+        col.prop(op, "gen_subd_ngon", text="Clear Previous Selection")
+        col.prop(op, "sel_rand_invert", text="Deselect", toggle=True)
+        col.prop_search(op, "sel_vgroup", ob, "vertex_groups", text="Group")
+
+    @staticmethod
+    def __bysides(ob: Object, col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup) -> None:
+        col.prop(op, "gen_ins_interp", text="Clear Selection")
+        col.prop(op, "fill_holes", text="Vertices")
+        col.prop(op, "sel_bysides_type")
+        col.prop(op, "gen_subd_ngon", text="Extend")
+
+    @staticmethod
+    def __custom(ob: Object, col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup) -> None:
         """Custom Select"""
         col.prop(op, "sel_cstm_clear_previous_selection")
         if not op.sel_cstm_clear_previous_selection:
@@ -603,11 +577,12 @@ class STACKS_UI_OPS_Select:
         # col.prop(op, "sel_cstm_element_type")  # Not implemented yet
         if op.sel_cstm_element_type == "VERTS":
             col.prop(op, "sel_cstm_vert_type", text="Mode")
-            if op.sel_cstm_vert_type in {"EDGENUM", "FACENUM"}:
+            vert_type = op.sel_cstm_vert_type
+            if vert_type in {"EDGENUM", "FACENUM"}:
                 col.separator()
                 row = col.row(align=True)
-                row.prop(op, "sel_cstm_edge_facenum" if op.sel_cstm_vert_type == "EDGENUM" else "sel_cstm_face_vnum",
-                         text=f"{dict({True: 'More or equal:', False: 'Less than:'})[op.gen_ins_outset]}")
+                row.prop(op, "sel_cstm_edge_facenum" if vert_type == "EDGENUM" else "sel_cstm_face_vnum",
+                         text=_OUTSET_LABELS[op.gen_ins_outset])
                 row.prop(op, "gen_ins_outset", text="", toggle=True, icon="UV_SYNC_SELECT")
                 return
         # # Following is not implemented yet:
@@ -632,16 +607,17 @@ class STACKS_UI_OPS_Select:
             raise NotImplementedError
 
         col.prop(op, "sel_cstm_pivot", text="Pivot")
-        if op.sel_cstm_vert_type in {"BELOW", "ABOVE"}:
+        manual = op.sel_cstm_pivot == "MANUAL"
+        if vert_type in {"BELOW", "ABOVE"}:
             col.prop(op, "sel_cstm_axis")
-            if op.sel_cstm_pivot == "MANUAL":
-                axis = {"X": 0, "Y": 1, "Z": 2}[op.sel_cstm_axis]
+            if manual:
+                axis = _AXIS_INDEX[op.sel_cstm_axis]
                 col.prop(op, "sel_cstm_center", index=axis)
             else:
                 col.prop(op, "sel_cstm_target", text="Target")
-        elif op.sel_cstm_vert_type == "SPHERE":
+        elif vert_type == "SPHERE":
             col.prop(op, "sel_cstm_sphere_size", text="Size")
-            if op.sel_cstm_pivot == "MANUAL":
+            if manual:
                 col.prop(op, "sel_cstm_center", text="Center")
             else:
                 col.prop(op, "sel_cstm_target", text="Target")
@@ -651,37 +627,39 @@ class STACKS_UI_OPS_Select:
         # col.prop(op, "sel_cstm_noise_scale")
         # col.prop(op, "sel_cstm_noise_falloff")
 
+    # Select Operator: label of the settings-free operators
+    _LABELS = {
+        'ALL': "Select All",
+        'DESELECT': "Deselect All",
+        'INVERT': "Invert Selection",
+        'LOOSE': "Select Loose Geometry",
+        'NON_MANIFOLD': "Select Non-Manifold Geometry",
+        'BOUNDARY': "Select Boundary Loop",
+    }
+
+    # Select Operator: drawing function with the (ob, col, op, stack_ob) signature.
+    # Plain functions unwrapped from staticmethod: staticmethod objects are not callable before Python 3.10
+    _DISPATCH = {
+        'RANDOM': __random.__func__,
+        'SHARP': __sharp.__func__,
+        'MORE': __more.__func__,
+        'CUSTOM': __custom.__func__,
+        'VGROUP': __vgroup.__func__,
+        'BYSIDES': __bysides.__func__,
+    }
+
 
 # ---------------------------------------------------- OPS GENERATE ----------------------------------------------------
 
 
 class STACKS_UI_OPS_Generate:
     """UI Layout: Generate Operators panels drawing"""
+    __slots__ = ()
+
     def __init__(self, col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup):
-        if op.ops_generate == 'EXTRUDE':
-            self.__extrude(col, op, stack_ob)
-        elif op.ops_generate == 'SUBDIVIDE':
-            self.__subdivide(col, op, stack_ob)
-        elif op.ops_generate == 'BEVEL':
-            self.__bevel(col, op, stack_ob)
-        elif op.ops_generate == 'SOLIDIFY':
-            self.__solidify(col, op, stack_ob)
-        elif op.ops_generate == 'WIREFRAME':
-            self.__wireframe(col, op, stack_ob)
-        elif op.ops_generate == 'MIRROR':
-            self.__mirror(col, op)
-        elif op.ops_generate == 'DUPLICATE':
-            self.__duplicate(col, op, stack_ob)
-        elif op.ops_generate == 'SPLIT':
-            self.__split(col, op)
-        elif op.ops_generate == 'LOOPCUT':
-            self.__loopcut(col, op)
-        elif op.ops_generate == 'INSET':
-            self.__inset(col, op, stack_ob)
-        elif op.ops_generate == 'QUADS':
-            self.__quads(col, op)
-        elif op.ops_generate == 'BOOLEAN':
-            self.__boolean(col, op)
+        draw = self._DISPATCH.get(op.ops_generate)
+        if draw is not None:
+            draw(col, op, stack_ob)
 
     @staticmethod
     def __extrude(col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup):
@@ -707,15 +685,16 @@ class STACKS_UI_OPS_Generate:
     @staticmethod
     def __bevel(col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup):
         """Generate Bevel"""
-        col.prop(op, "gen_b_affect", text="Affect")
-        col.prop(op, "gen_b_off_type", text="Type")
+        prop = col.prop  # bound once: UILayout attributes resolve through RNA on every access
+        prop(op, "gen_b_affect", text="Affect")
+        prop(op, "gen_b_off_type", text="Type")
         row = col.row(align=True)
         row.prop(op, "gen_b_clmp_ovrlp", text="Clamp Overlap")
         row.prop(op, "gen_b_loop_slide", text="Loop Slide")
         interp("GENERATE", "BEVEL", "gen_b_offset_pct" if op.gen_b_off_type == 'PERCENT' else "gen_b_offset",
                col, op, stack_ob=stack_ob)
-        col.prop(op, "gen_b_segments", text="Segments")
-        col.prop(op, "gen_b_profile", text="Profile")
+        prop(op, "gen_b_segments", text="Segments")
+        prop(op, "gen_b_profile", text="Profile")
         row = col.row(align=True)
         rcol = row.column(align=True)
         rcol.label(text='Miter Out:')
@@ -735,7 +714,7 @@ class STACKS_UI_OPS_Generate:
         rcol.label(text="Face Strength:")
         rcol.prop(op, "gen_b_f_str_mode", text="")
         rcol.prop(op, "gen_b_hard_norm", text="Harden Normals")
-        col.prop(op, "gen_b_material", text="Material Offset")
+        prop(op, "gen_b_material", text="Material Offset")
         row = col.row(align=True)
         row.prop(op, "gen_b_mark_seam", text="Mark Seam")
         row.prop(op, "gen_b_mark_sharp", text="Mark Sharp")
@@ -762,7 +741,7 @@ class STACKS_UI_OPS_Generate:
         col.prop(op, "gen_wrf_replace", text="Replace")
 
     @staticmethod
-    def __mirror(col: UILayout, op: PropertyGroup):
+    def __mirror(col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup = None):
         """Generate Mirror"""
         col.label(text="Axis Constraints:")
         row = col.row(align=True)
@@ -771,9 +750,10 @@ class STACKS_UI_OPS_Generate:
         row.prop(op, "gen_mir_constr_z", text="Z", toggle=True)
         col.prop(op, "orientation_type", text="Orient")
         col.prop(op, "gen_mir_pivot", text="Pivot")
-        if op.gen_mir_pivot == 'OBJECT':
+        pivot = op.gen_mir_pivot
+        if pivot == 'OBJECT':
             col.prop(op, "gen_mir_object", text="Object")
-        elif op.gen_mir_pivot == 'MANUAL':
+        elif pivot == 'MANUAL':
             col.prop(op, "gen_mir_center", text="Center Override")
         col.prop(op, "gen_mir_accurate", text="Accurate")
 
@@ -788,12 +768,12 @@ class STACKS_UI_OPS_Generate:
         interp("GENERATE", "DUPLICATE", "gen_scale", col, op, stack_ob=stack_ob, label="Scale")
 
     @staticmethod
-    def __split(col: UILayout, op: PropertyGroup):
+    def __split(col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup = None):
         """Generate Split"""
         col.prop(op, "gen_split_type", text="Type")
 
     @staticmethod
-    def __loopcut(col: UILayout, op: PropertyGroup):
+    def __loopcut(col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup = None):
         """Generate Loop Cut"""
         col.prop(op, "gen_loop_falloff", text="Falloff")
         row = col.row(align=True)
@@ -805,71 +785,92 @@ class STACKS_UI_OPS_Generate:
     @staticmethod
     def __inset(col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup):
         """Generate Inset"""
-        col.prop(op, "gen_ins_boundary", text="Boundary")
-        col.prop(op, "gen_ins_even", text="Even Offset")
-        col.prop(op, "gen_ins_relative", text="Relative Offset")
-        col.prop(op, "gen_ins_edgerail", text="Edge Rail")
+        prop = col.prop
+        prop(op, "gen_ins_boundary", text="Boundary")
+        prop(op, "gen_ins_even", text="Even Offset")
+        prop(op, "gen_ins_relative", text="Relative Offset")
+        prop(op, "gen_ins_edgerail", text="Edge Rail")
         interp("GENERATE", "INSET", "gen_ins_thick", col, op, stack_ob=stack_ob, label="Thickness")
         interp("GENERATE", "INSET", "gen_ins_depth", col, op, stack_ob=stack_ob, label="Depth")
-        col.prop(op, "gen_ins_outset", text="Outset")
-        col.prop(op, "gen_ins_selinset", text="Select Inset")
-        col.prop(op, "gen_ins_individ", text="Individual")
-        col.prop(op, "gen_ins_interp", text="Interpolate")
+        prop(op, "gen_ins_outset", text="Outset")
+        prop(op, "gen_ins_selinset", text="Select Inset")
+        prop(op, "gen_ins_individ", text="Individual")
+        prop(op, "gen_ins_interp", text="Interpolate")
 
     @staticmethod
-    def __quads(col: UILayout, op: PropertyGroup):
+    def __quads(col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup = None):
         """Generate Quads"""
         col.prop(op, "gen_tri_face", text="Face Threshold")
         col.prop(op, "gen_tri_shape", text="Shape Threshold")
 
     @staticmethod
-    def __boolean(col: UILayout, op: PropertyGroup):
+    def __boolean(col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup = None):
         """Generate Boolean"""
         col = col.column()
         col.label(text="Subject:")
         row = col.row(align=True)
-        row.prop_enum(op, "gen_bool_subject", "SELECTION")
-        row.prop_enum(op, "gen_bool_subject", "OBJECT")
-        col = col.column()
+        for subject in ('SELECTION', 'OBJECT'):
+            row.prop_enum(op, "gen_bool_subject", subject)
         col.label(text="Operation:")
         row = col.row(align=True)
-        row.prop_enum(op, "gen_bool_operation", "INTERSECT")
-        row.prop_enum(op, "gen_bool_operation", "UNION")
-        row.prop_enum(op, "gen_bool_operation", "DIFFERENCE")
+        for operation in ('INTERSECT', 'UNION', 'DIFFERENCE'):
+            row.prop_enum(op, "gen_bool_operation", operation)
         if op.gen_bool_subject == 'OBJECT':
             col.prop(op, "gen_bool_object", text="Object")
-        col = col.column()
         col.label(text="Solver:")
         row = col.row(align=True)
-        row.prop_enum(op, "gen_bool_solver", "FAST")
-        row.prop_enum(op, "gen_bool_solver", "EXACT")
-        if op.gen_bool_solver == 'FAST':
+        for solver in ('FAST', 'EXACT'):
+            row.prop_enum(op, "gen_bool_solver", solver)
+        solver = op.gen_bool_solver
+        if solver == 'FAST':
             col.prop(op, "gen_bool_overlap_threshold", text="Overlap")
-        elif op.gen_bool_solver == 'EXACT':
+        elif solver == 'EXACT':
             col.prop(op, "gen_extr_ind", text="Self Intersection")
             col.prop(op, "gen_b_hard_norm", text="Hole Tolerant")
 
+    # Generate Operator: drawing function with the (col, op, stack_ob) signature
+    _DISPATCH = {
+        'EXTRUDE': __extrude.__func__,
+        'SUBDIVIDE': __subdivide.__func__,
+        'BEVEL': __bevel.__func__,
+        'SOLIDIFY': __solidify.__func__,
+        'WIREFRAME': __wireframe.__func__,
+        'MIRROR': __mirror.__func__,
+        'DUPLICATE': __duplicate.__func__,
+        'SPLIT': __split.__func__,
+        'LOOPCUT': __loopcut.__func__,
+        'INSET': __inset.__func__,
+        'QUADS': __quads.__func__,
+        'BOOLEAN': __boolean.__func__,
+    }
+
 
 # ----------------------------------------------------- OPS DEFORM -----------------------------------------------------
 
 
 class STACKS_UI_OPS_Deform:
     """UI Layout: Deform Operators panels drawing"""
+    __slots__ = ()
+
     def __init__(self, col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup):
-        if op.ops_deform == 'SPHERE':
-            interp("DEFORM", "SPHERE", "sel_rand_ratio", col, op, stack_ob=stack_ob, label="Factor")
-        elif op.ops_deform == 'RANDOMIZE':
-            self.__randomize(col, op, stack_ob)
-        elif op.ops_deform == 'SMOOTH':
-            interp("DEFORM", "SMOOTH", "gen_subd_smooth", col, op, stack_ob=stack_ob, label="Factor")
-        elif op.ops_deform == 'PUSH':
-            interp("DEFORM", "PUSH", "gen_extr_indval", col, op, stack_ob=stack_ob, label="Factor")
-        elif op.ops_deform == 'WARP':
-            self.__warp(col, op)
-        elif op.ops_deform == 'SHRINK':
-            self.__shrink(col, op, stack_ob)
-        elif op.ops_deform == 'SHEAR':
-            self.__shear(col, op, stack_ob)
+        draw = self._DISPATCH.get(op.ops_deform)
+        if draw is not None:
+            draw(col, op, stack_ob)
+
+    @staticmethod
+    def __sphere(col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup):
+        """Deform To Sphere"""
+        interp("DEFORM", "SPHERE", "sel_rand_ratio", col, op, stack_ob=stack_ob, label="Factor")
+
+    @staticmethod
+    def __smooth(col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup):
+        """Deform Smooth"""
+        interp("DEFORM", "SMOOTH", "gen_subd_smooth", col, op, stack_ob=stack_ob, label="Factor")
+
+    @staticmethod
+    def __push(col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup):
+        """Deform Push/Pull"""
+        interp("DEFORM", "PUSH", "gen_extr_indval", col, op, stack_ob=stack_ob, label="Factor")
 
     @staticmethod
     def __randomize(col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup):
@@ -880,14 +881,15 @@ class STACKS_UI_OPS_Deform:
         col.prop(op, "sel_rand_seed", text="Seed")
 
     @staticmethod
-    def __warp(col: UILayout, op: PropertyGroup):
+    def __warp(col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup = None):
         """Deform Warp"""
-        col.prop(op, "def_warp_angle1", text="Warp Angle")
-        col.prop(op, "def_warp_angle2", text="Offset Angle")
-        col.prop(op, "def_warp_min", text="Min")
-        col.prop(op, "def_warp_max", text="Max")
-        col.prop(op, "def_warp_center", text="Center")
-        col.prop(op, "def_warp_rotate", text="Rotate")
+        prop = col.prop
+        prop(op, "def_warp_angle1", text="Warp Angle")
+        prop(op, "def_warp_angle2", text="Offset Angle")
+        prop(op, "def_warp_min", text="Min")
+        prop(op, "def_warp_max", text="Max")
+        prop(op, "def_warp_center", text="Center")
+        prop(op, "def_warp_rotate", text="Rotate")
 
     @staticmethod
     def __shrink(col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup):
@@ -903,21 +905,39 @@ class STACKS_UI_OPS_Deform:
         col.prop(op, "def_shear_axis", text="Orient Axis")
         col.prop(op, "def_shear_ax_ort", text="Axis Ortho")
 
+    # Deform Operator: drawing function with the (col, op, stack_ob) signature
+    _DISPATCH = {
+        'SPHERE': __sphere.__func__,
+        'RANDOMIZE': __randomize.__func__,
+        'SMOOTH': __smooth.__func__,
+        'PUSH': __push.__func__,
+        'WARP': __warp.__func__,
+        'SHRINK': __shrink.__func__,
+        'SHEAR': __shear.__func__,
+    }
+
 
 # --------------------------------------------------- OPS TRANSFORM ----------------------------------------------------
 
 
 class STACKS_UI_OPS_Transform:
     """UI Layout: Transform Operators panels drawing"""
+    __slots__ = ()
+
     def __init__(self, col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup):
         col.prop(op, "orientation_type", text="Orient")
         col.prop(op, "pivot_point", text="Pivot")
-        if op.ops_transform == 'GRAB':
-            interp("TRANSFORM", "GRAB", "gen_grab", col, op, stack_ob=stack_ob)
-        elif op.ops_transform == 'ROTATE':
-            interp("TRANSFORM", "ROTATE", "gen_rotate", col, op, stack_ob=stack_ob)
-        elif op.ops_transform == 'SCALE':
-            interp("TRANSFORM", "SCALE", "gen_scale", col, op, stack_ob=stack_ob)
+        kind = op.ops_transform
+        prop = self._PROPS.get(kind)
+        if prop is not None:
+            interp("TRANSFORM", kind, prop, col, op, stack_ob=stack_ob)
+
+    # Transform Operator: interpolated property
+    _PROPS = {
+        'GRAB': "gen_grab",
+        'ROTATE': "gen_rotate",
+        'SCALE': "gen_scale",
+    }
 
 
 # ---------------------------------------------------- OPS CLEAN UP ----------------------------------------------------
@@ -925,17 +945,16 @@ class STACKS_UI_OPS_Transform:
 
 class STACKS_UI_OPS_Cleanup:
     """UI Layout: Clean Up Operators panels drawing"""
+    __slots__ = ()
+
     def __init__(self, col: UILayout, op: PropertyGroup):
-        if op.ops_cleanup == 'DELETE':
-            col.prop(op, "cln_delete", text="Delete")
-        elif op.ops_cleanup == 'DISSOLVE':
-            self.__dissolve(col, op)
-        elif op.ops_cleanup == 'LOOSE':
-            self.__loose(col, op)
-        elif op.ops_cleanup == 'DECIMATE':
-            self.__decimate(col, op)
-        elif op.ops_cleanup == 'MERGE':
-            self.__merge(col, op)
+        draw = self._DISPATCH.get(op.ops_cleanup)
+        if draw is not None:
+            draw(col, op)
+
+    @staticmethod
+    def __delete(col: UILayout, op: PropertyGroup):
+        col.prop(op, "cln_delete", text="Delete")
 
     @staticmethod
     def __dissolve(col: UILayout, op: PropertyGroup):
@@ -954,9 +973,10 @@ class STACKS_UI_OPS_Cleanup:
     @staticmethod
     def __decimate(col: UILayout, op: PropertyGroup):
         col.prop(op, "cln_decimate")
-        if op.cln_decimate == 'COLLAPSE':
+        decimate = op.cln_decimate
+        if decimate == 'COLLAPSE':
             col.prop(op, "gen_b_profile", text='Ratio')
-        elif op.cln_decimate == 'PLANAR':
+        elif decimate == 'PLANAR':
             col.prop(op, "sel_sharp", text='Angel Limit')
 
     @staticmethod
@@ -967,30 +987,44 @@ class STACKS_UI_OPS_Cleanup:
             col.prop(op, "cln_mrg_thresh", text="Thresh.")
             col.prop(op, "cln_mrg_unselect", text="Use Unselected")
 
+    # Clean Up Operator: drawing function with the (col, op) signature
+    _DISPATCH = {
+        'DELETE': __delete.__func__,
+        'DISSOLVE': __dissolve.__func__,
+        'LOOSE': __loose.__func__,
+        'DECIMATE': __decimate.__func__,
+        'MERGE': __merge.__func__,
+    }
+
 
 # ---------------------------------------------------- OPS NORMALS ----------------------------------------------------
 
 
 class STACKS_UI_OPS_Normals:
     """UI Layout: Normals Operators panels drawing"""
+    __slots__ = ()
+
     def __init__(self, col: UILayout, op: PropertyGroup):
-        if op.ops_normals == 'FLAT':
-            col.label(text="Shade Flat")
-        elif op.ops_normals == 'SMOOTH':
-            col.label(text="Shade Smooth")
+        kind = op.ops_normals
+        label = self._LABELS.get(kind)
+        if label is not None:
+            col.label(text=label)
+        if kind == 'SMOOTH':
             row = col.row()
             row.prop(op, "gen_extr_ind", text="Auto-Smooth")
             row.prop(op, "sel_sharp", text="")
-        elif op.ops_normals == 'FLIP':
-            col.label(text="Flip Normals")
-        elif op.ops_normals == 'OUTSIDE':
-            col.label(text="Recalculate Normals Outside")
-        elif op.ops_normals == 'INSIDE':
-            col.label(text="Recalculate Normals Inside")
-        elif op.ops_normals == 'MARKSHARP':
+        elif kind == 'MARKSHARP':
             col.prop(op, "gen_b_loop_slide", text="Mark Sharp")
-        elif op.ops_normals == 'SHARP_CLEAR':
-            col.label(text="Clear Edges Sharp")
+
+    # Normals Operator: label drawn on top of the settings
+    _LABELS = {
+        'FLAT': "Shade Flat",
+        'SMOOTH': "Shade Smooth",
+        'FLIP': "Flip Normals",
+        'OUTSIDE': "Recalculate Normals Outside",
+        'INSIDE': "Recalculate Normals Inside",
+        'SHARP_CLEAR': "Clear Edges Sharp",
+    }
 
 
 # ---------------------------------------------------- OPS ASSIGN -----------------------------------------------------
@@ -998,29 +1032,40 @@ class STACKS_UI_OPS_Normals:
 
 class STACKS_UI_OPS_Assign:
     """UI Layout: Assign Operators panels drawing"""
+    __slots__ = ()
+
     def __init__(self, ob: Object, col: UILayout, op: PropertyGroup):
-        if op.ops_assign == "MATERIAL":
-            self.__material(col, op)
-        elif op.ops_assign == "SKIN":
-            col.prop(op, "asn_crease_v", text="Skin Resize")
-        elif op.ops_assign == "CREASE":
-            col.prop(op, "asn_crease_v", text="Vertices Crease")
-            col.prop(op, "asn_crease_e", text="Edges Crease")
-        elif op.ops_assign == "BEVEL":
-            col.prop(op, "asn_crease_v", text="Vertices Weight")
-            col.prop(op, "asn_crease_e", text="Edges Weight")
-        elif op.ops_assign == "SEAM":
-            col.prop(op, "gen_b_loop_slide", text="Mark Seam", toggle=True)
-        elif op.ops_assign == "SHARP":
-            col.prop(op, "gen_b_loop_slide", text="Mark Sharp", toggle=True)
-        elif op.ops_assign == 'VGROUP':
-            self.__vgroup(ob, col, op)
+        draw = self._DISPATCH.get(op.ops_assign)
+        if draw is not None:
+            draw(ob, col, op)
 
     @staticmethod
-    def __material(col: UILayout, op: PropertyGroup):
+    def __material(ob: Object, col: UILayout, op: PropertyGroup):
         col.prop(op, "asn_material", text="Material")
         col.operator("stacks.update", text="Assign")
 
+    @staticmethod
+    def __skin(ob: Object, col: UILayout, op: PropertyGroup):
+        col.prop(op, "asn_crease_v", text="Skin Resize")
+
+    @staticmethod
+    def __crease(ob: Object, col: UILayout, op: PropertyGroup):
+        col.prop(op, "asn_crease_v", text="Vertices Crease")
+        col.prop(op, "asn_crease_e", text="Edges Crease")
+
+    @staticmethod
+    def __bevel(ob: Object, col: UILayout, op: PropertyGroup):
+        col.prop(op, "asn_crease_v", text="Vertices Weight")
+        col.prop(op, "asn_crease_e", text="Edges Weight")
+
+    @staticmethod
+    def __seam(ob: Object, col: UILayout, op: PropertyGroup):
+        col.prop(op, "gen_b_loop_slide", text="Mark Seam", toggle=True)
+
+    @staticmethod
+    def __sharp(ob: Object, col: UILayout, op: PropertyGroup):
+        col.prop(op, "gen_b_loop_slide", text="Mark Sharp", toggle=True)
+
     @staticmethod
     def __vgroup(ob: Object, col: UILayout, op: PropertyGroup):
         col.prop(op, "sel_rand_invert", text="Remove", toggle=True)
@@ -1029,29 +1074,30 @@ class STACKS_UI_OPS_Assign:
         row.operator("stacks.new_vgroup", text="", icon="FILE_NEW").op_index = op.index
         col.prop(op, "sel_weight", text="Weight")
 
+    # Assign Operator: drawing function with the (ob, col, op) signature
+    _DISPATCH = {
+        'MATERIAL': __material.__func__,
+        'SKIN': __skin.__func__,
+        'CREASE': __crease.__func__,
+        'BEVEL': __bevel.__func__,
+        'SEAM': __seam.__func__,
+        'SHARP': __sharp.__func__,
+        'VGROUP': __vgroup.__func__,
+    }
+
 
 # ------------------------------------------------------ OPS ADD -------------------------------------------------------
 
 
 class STACKS_UI_OPS_Add:
     """UI Layout: Assign Operators panels drawing"""
+    __slots__ = ()
+
     def __init__(self, col: UILayout, op: PropertyGroup, stack_ob: PropertyGroup):
-        if op.ops_add in {"PLANE", "CUBE", "MONKEY"}:
-            self.__plane_cube_monkey(col, op, op.ops_add, stack_ob)
-        elif op.ops_add == "CIRCLE":
-            self.__circle(col, op, op.ops_add, stack_ob)
-        elif op.ops_add == "UVSPHERE":
-            self.__uv_sphere(col, op, op.ops_add, stack_ob)
-        elif op.ops_add == "ICOSPHERE":
-            self.__ico_sphere(col, op, op.ops_add, stack_ob)
-        elif op.ops_add == "CYLINDER":
-            self.__cylinder(col, op, op.ops_add, stack_ob)
-        elif op.ops_add == "CONE":
-            self.__cone(col, op, op.ops_add, stack_ob)
-        elif op.ops_add == "TORUS":
-            self.__torus(col, op, op.ops_add, stack_ob)
-        elif op.ops_add == "GRID":
-            self.__grid(col, op, op.ops_add, stack_ob)
+        kind = op.ops_add
+        draw = self._DISPATCH.get(kind)
+        if draw is not None:
+            draw(col, op, kind, stack_ob)
 
     @staticmethod
     def __transforms(col: UILayout, op: PropertyGroup, op_type: str, stack_ob: PropertyGroup):
@@ -1059,44 +1105,17 @@ class STACKS_UI_OPS_Add:
         interp("ADD", op_type, "gen_rotate", col, op, stack_ob=stack_ob, label="Rotation")
         interp("ADD", op_type, "gen_scale", col, op, stack_ob=stack_ob, label="Scale")
 
-    def __plane_cube_monkey(self, col: UILayout, op: PropertyGroup, op_type: str, stack_ob: PropertyGroup):
-        """Settings are the same for Plane, Cube and Monkey Primitives"""
-        interp("ADD", op_type, "add_size", col, op, stack_ob=stack_ob, label="Size")
-        self.__transforms(col, op, op_type, stack_ob)
-
-    def __circle(self, col: UILayout, op: PropertyGroup, op_type: str, stack_ob: PropertyGroup):
-        interp("ADD", op_type, "add_circ_verts", col, op, stack_ob=stack_ob, label="Vertices")
-        interp("ADD", op_type, "add_radius", col, op, stack_ob=stack_ob, label="Radius")
-        col.prop(op, "add_circ_fill", text="Fill")
-        self.__transforms(col, op, op_type, stack_ob)
-
-    def __uv_sphere(self, col: UILayout, op: PropertyGroup, op_type: str, stack_ob: PropertyGroup):
-        interp("ADD", op_type, "add_circ_verts", col, op, stack_ob=stack_ob, label="Segments")
-        interp("ADD", op_type, "add_sphr_rings", col, op, stack_ob=stack_ob, label="Ring Count")
-        interp("ADD", op_type, "add_radius", col, op, stack_ob=stack_ob, label="Radius")
-        self.__transforms(col, op, op_type, stack_ob)
-
-    def __ico_sphere(self, col: UILayout, op: PropertyGroup, op_type: str, stack_ob: PropertyGroup):
-        interp("ADD", op_type, "add_sphr_ico", col, op, stack_ob=stack_ob, label="Subdivisions")
-        interp("ADD", op_type, "add_radius", col, op, stack_ob=stack_ob, label="Radius")
-        self.__transforms(col, op, op_type, stack_ob)
-
-    def __cylinder(self, col: UILayout, op: PropertyGroup, op_type: str, stack_ob: PropertyGroup):
-        interp("ADD", op_type, "add_circ_verts", col, op, stack_ob=stack_ob, label="Vertices")
-        interp("ADD", op_type, "add_radius", col, op, stack_ob=stack_ob, label="Radius")
-        interp("ADD", op_type, "add_radius2", col, op, stack_ob=stack_ob, label="Depth")
-        col.separator()
-        col.prop(op, "add_circ_fill", text="Fill")
-        self.__transforms(col, op, op_type, stack_ob)
-
-    def __cone(self, col: UILayout, op: PropertyGroup, op_type: str, stack_ob: PropertyGroup):
-        interp("ADD", op_type, "add_circ_verts", col, op, stack_ob=stack_ob, label="Vertices")
-        interp("ADD", op_type, "add_radius", col, op, stack_ob=stack_ob, label="Radius 1")
-        interp("ADD", op_type, "gen_ins_thick", col, op, stack_ob=stack_ob, label="Radius 2")
-        interp("ADD", op_type, "add_sphr_ico", col, op, stack_ob=stack_ob, label="Depth")
-        col.separator()
-        col.prop(op, "add_circ_fill", text="Fill")
-        self.__transforms(col, op, op_type, stack_ob)
+    @staticmethod
+    def __primitive(col: UILayout, op: PropertyGroup, op_type: str, stack_ob: PropertyGroup):
+        """Settings of all the Primitives but Torus: interpolated parameters, Fill and transforms"""
+        params, fill, separated = STACKS_UI_OPS_Add._SPECS[op_type]
+        for prop, label in params:
+            interp("ADD", op_type, prop, col, op, stack_ob=stack_ob, label=label)
+        if separated:
+            col.separator()
+        if fill:
+            col.prop(op, "add_circ_fill", text="Fill")
+        STACKS_UI_OPS_Add.__transforms(col, op, op_type, stack_ob)
 
     @staticmethod
     def __torus(col: UILayout, op: PropertyGroup, op_type: str, stack_ob: PropertyGroup):
@@ -1104,18 +1123,42 @@ class STACKS_UI_OPS_Add:
         interp("ADD", op_type, "add_tor_seg_min", col, op, stack_ob=stack_ob, label="Minor Segments")
         col.separator()
         col.prop(op, "add_tor_mode")
-        interp("ADD", op_type, f"add_tor_rad{'_abso' if op.add_tor_mode == 'EXT_INT' else ''}_maj",
-               col, op, stack_ob=stack_ob, label="Major Radius")
-        interp("ADD", op_type, f"add_tor_rad{'_abso' if op.add_tor_mode == 'EXT_INT' else ''}_min",
-               col, op, stack_ob=stack_ob, label="Minor Radius")
+        rad_maj, rad_min = _TORUS_RAD[op.add_tor_mode == 'EXT_INT']
+        interp("ADD", op_type, rad_maj, col, op, stack_ob=stack_ob, label="Major Radius")
+        interp("ADD", op_type, rad_min, col, op, stack_ob=stack_ob, label="Minor Radius")
         interp("ADD", op_type, "gen_grab", col, op, stack_ob=stack_ob, label="Location")
         interp("ADD", op_type, "gen_rotate", col, op, stack_ob=stack_ob, label="Rotation")
 
-    def __grid(self, col: UILayout, op: PropertyGroup, op_type: str, stack_ob: PropertyGroup):
-        interp("ADD", op_type, "add_grid_x", col, op, stack_ob=stack_ob, label="X Subdivisions")
-        interp("ADD", op_type, "add_grid_y", col, op, stack_ob=stack_ob, label="Y Subdivisions")
-        interp("ADD", op_type, "add_size", col, op, stack_ob=stack_ob, label="Size")
-        self.__transforms(col, op, op_type, stack_ob)
+    # Add Operator: drawing function with the (col, op, op_type, stack_ob) signature
+    _DISPATCH = {
+        'PLANE': __primitive.__func__,
+        'CUBE': __primitive.__func__,
+        'MONKEY': __primitive.__func__,
+        'CIRCLE': __primitive.__func__,
+        'UVSPHERE': __primitive.__func__,
+        'ICOSPHERE': __primitive.__func__,
+        'CYLINDER': __primitive.__func__,
+        'CONE': __primitive.__func__,
+        'TORUS': __torus.__func__,
+        'GRID': __primitive.__func__,
+    }
+
+    # Add Operator: ((interpolated property, label), ...), Fill drawn, separator before Fill
+    _SPECS = {
+        'PLANE': ((("add_size", "Size"),), False, False),
+        'CUBE': ((("add_size", "Size"),), False, False),
+        'MONKEY': ((("add_size", "Size"),), False, False),
+        'CIRCLE': ((("add_circ_verts", "Vertices"), ("add_radius", "Radius")), True, False),
+        'UVSPHERE': ((("add_circ_verts", "Segments"), ("add_sphr_rings", "Ring Count"),
+                      ("add_radius", "Radius")), False, False),
+        'ICOSPHERE': ((("add_sphr_ico", "Subdivisions"), ("add_radius", "Radius")), False, False),
+        'CYLINDER': ((("add_circ_verts", "Vertices"), ("add_radius", "Radius"),
+                      ("add_radius2", "Depth")), True, True),
+        'CONE': ((("add_circ_verts", "Vertices"), ("add_radius", "Radius 1"), ("gen_ins_thick", "Radius 2"),
+                  ("add_sphr_ico", "Depth")), True, True),
+        'GRID': ((("add_grid_x", "X Subdivisions"), ("add_grid_y", "Y Subdivisions"),
+                  ("add_size", "Size")), False, False),
+    }
 
 
 # ----------------------------------------------------- OPS FILL -------------------------------------------------------
@@ -1123,15 +1166,16 @@ class STACKS_UI_OPS_Add:
 
 class STACKS_UI_OPS_Fill:
     """UI Layout: Assign Operators panels drawing"""
+    __slots__ = ()
+
     def __init__(self, col: UILayout, op: PropertyGroup):
-        if op.ops_fill == 'FILL':
-            col.prop(op, 'gen_subd_ngon', text='Beauty')
-        elif op.ops_fill == 'GRIDFILL':
-            self.__gridfill(col, op)
-        elif op.ops_fill == 'BRIDGEEDGE':
-            self.__bridgeedge(col, op)
-        elif op.ops_fill == 'FILLHOLES':
-            col.prop(op, "fill_holes", text="Sides")
+        draw = self._DISPATCH.get(op.ops_fill)
+        if draw is not None:
+            draw(col, op)
+
+    @staticmethod
+    def __fill(col: UILayout, op: PropertyGroup) -> None:
+        col.prop(op, 'gen_subd_ngon', text='Beauty')
 
     @staticmethod
     def __gridfill(col: UILayout, op: PropertyGroup) -> None:
@@ -1141,15 +1185,45 @@ class STACKS_UI_OPS_Fill:
 
     @staticmethod
     def __bridgeedge(col: UILayout, op: PropertyGroup) -> None:
-        col.prop(op, 'fill_bridge_type')
-        col.prop(op, 'gen_extr_ind', text='Merge')
-        col.prop(op, 'gen_b_profile', text='Merge Fac.')
-        col.prop(op, 'gen_loop_smooth', text='Twist')
-        col.prop(op, 'gen_subd_cuts', text='Cuts')
-        col.prop(op, 'fill_bridge_interp')
-        col.prop(op, 'fill_bridge_smooth', text='Smooth')
-        col.prop(op, 'fill_bridge_profile', text='Profile')
-        col.prop(op, 'gen_loop_falloff', text='Shape')
+        prop = col.prop
+        prop(op, 'fill_bridge_type')
+        prop(op, 'gen_extr_ind', text='Merge')
+        prop(op, 'gen_b_profile', text='Merge Fac.')
+        prop(op, 'gen_loop_smooth', text='Twist')
+        prop(op, 'gen_subd_cuts', text='Cuts')
+        prop(op, 'fill_bridge_interp')
+        prop(op, 'fill_bridge_smooth', text='Smooth')
+        prop(op, 'fill_bridge_profile', text='Profile')
+        prop(op, 'gen_loop_falloff', text='Shape')
+
+    @staticmethod
+    def __fillholes(col: UILayout, op: PropertyGroup) -> None:
+        col.prop(op, "fill_holes", text="Sides")
+
+    # Fill Operator: drawing function with the (col, op) signature
+    _DISPATCH = {
+        'FILL': __fill.__func__,
+        'GRIDFILL': __gridfill.__func__,
+        'BRIDGEEDGE': __bridgeedge.__func__,
+        'FILLHOLES': __fillholes.__func__,
+    }
+
+
+# --------------------------------------------- OPERATOR SETTINGS DISPATCH ---------------------------------------------
+
+
+# Operator Type: Settings drawing with the (ob, col, op, stack_ob) signature
+_OPS_PANEL = {
+    'SELECT': STACKS_UI_OPS_Select,
+    'GENERATE': lambda ob, col, op, stack_ob: STACKS_UI_OPS_Generate(col, op, stack_ob),
+    'DEFORM': lambda ob, col, op, stack_ob: STACKS_UI_OPS_Deform(col, op, stack_ob),
+    'TRANSFORM': lambda ob, col, op, stack_ob: STACKS_UI_OPS_Transform(col, op, stack_ob),
+    'CLEANUP': lambda ob, col, op, stack_ob: STACKS_UI_OPS_Cleanup(col, op),
+    'NORMALS': lambda ob, col, op, stack_ob: STACKS_UI_OPS_Normals(col, op),
+    'ASSIGN': lambda ob, col, op, stack_ob: STACKS_UI_OPS_Assign(ob, col, op),
+    'ADD': lambda ob, col, op, stack_ob: STACKS_UI_OPS_Add(col, op, stack_ob),
+    'FILL': lambda ob, col, op, stack_ob: STACKS_UI_OPS_Fill(col, op),
+}
 
 
 # ---------------------------------------------------- MAIN PANEL ------------------------------------------------------
@@ -1178,28 +1252,19 @@ class STACKS_PT_Panel(Panel):
         if stacklist():
             return
             
-        stack_ob = ob.stacks_c[ob.stacks_active]
-        stack_type = STACKS_UI_StackMenu(col, ob, stack_ob, sc_common, sc)
+        stacks_active = ob.stacks_active
+        stack_ob = ob.stacks_c[stacks_active]
+        stack_type = STACKS_UI_StackMenu(col, ob, stack_ob, sc_common, sc, stacks_active)
         stack_sc, active_index = stack_type()
         # col = layout.column(align=True)
-        if stack_sc is None or active_index is None:
-            STACKS_UI_Presets(col, sc_common)
-            return
-
-        if active_index >= len(sc.stacks):
-            STACKS_UI_Presets(col, sc_common)
-            return
-        
-        STACKS_UI_OpsList(col, stack_ob, stack_sc, ob, active_index, sc_common)
-        if not len(stack_sc.ops):
-            STACKS_UI_Presets(col, sc_common)
-            return
-
-        op = stack_sc.ops[stack_sc.ops_active]
-        STACKS_UI_OpsType(col, op, sc_common)
-        if stack_ob.repeat > 1:
-            STACKS_UI_Interpolate(col, op, sc_common)
-        STACKS_UI_OpSettings(ob, col, op, sc_common, stack_ob)
+        if stack_sc is not None:  # operators stack with active_index in the scene stacks range
+            STACKS_UI_OpsList(col, stack_ob, stack_sc, ob, active_index, sc_common)
+            if len(stack_sc.ops):
+                op = stack_sc.ops[stack_sc.ops_active]
+                STACKS_UI_OpsType(col, op, sc_common)
+                if stack_ob.repeat > 1:
+                    STACKS_UI_Interpolate(col, op, sc_common)
+                STACKS_UI_OpSettings(ob, col, op, sc_common, stack_ob)
         # col = layout.column(align=True)
         STACKS_UI_Presets(col, sc_common)
             
@@ -1210,16 +1275,8 @@ classes = [
     STACKS_PT_Panel,
 ]
 
+register, unregister = register_classes_factory(classes)
 
-def register():
-    for cl in classes:
-        register_class(cl)
-        
-
-def unregister():
-    for cl in reversed(classes):
-        unregister_class(cl)
-        
 
 if __name__ == '__main__':
     register()